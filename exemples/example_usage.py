@@ -6,7 +6,10 @@ Exemples d'Utilisation de GitHub Stats Automation
 Ce fichier contient des exemples pratiques d'utilisation de la bibliothèque.
 """
 
+import io
 import sys
+import itertools
+from functools import lru_cache
 from pathlib import Path
 
 # Ajouter le répertoire parent au path
@@ -16,7 +19,24 @@ from src.config import Config
 from src.github_stats import GitHubStatsPrivate
 from src.cache_manager import CacheManager
 from src.rate_limiter import RateLimitHandler
-import json
+from src.utils import write_json
+
+# Ligne de séparation des sections
+_SEP = "=" * 70
+
+
+@lru_cache(maxsize=1)
+def _get_manager() -> GitHubStatsPrivate:
+    """
+    Instance partagée par les exemples utilisant la configuration par défaut
+    
+    Réutiliser la même instance conserve sa session HTTP (connexions
+    keep-alive) d'un exemple à l'autre.
+    """
+    return GitHubStatsPrivate(
+        token='ghp_your_token_here',
+        username='your_username'
+    )
 
 
 # ============================================================================
@@ -25,15 +45,12 @@ import json
 
 def example_basic():
     """Exemple basique de récupération de statistiques"""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("EXEMPLE 1 : Utilisation Basique")
-    print("=" * 70)
+    print(_SEP)
     
     # Initialiser avec token et username
-    stats_manager = GitHubStatsPrivate(
-        token='ghp_your_token_here',
-        username='your_username'
-    )
+    stats_manager = _get_manager()
     
     # Calculer toutes les stats
     stats = stats_manager.calculate_all_stats()
@@ -52,9 +69,9 @@ def example_basic():
 
 def example_custom_config():
     """Exemple avec configuration personnalisée"""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("EXEMPLE 2 : Configuration Personnalisée")
-    print("=" * 70)
+    print(_SEP)
     
     # Créer une configuration
     config = Config('configs/config.yaml')
@@ -82,14 +99,11 @@ def example_custom_config():
 
 def example_specific_stats():
     """Exemple de récupération de statistiques spécifiques"""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("EXEMPLE 3 : Statistiques Spécifiques")
-    print("=" * 70)
+    print(_SEP)
     
-    stats_manager = GitHubStatsPrivate(
-        token='ghp_your_token_here',
-        username='your_username'
-    )
+    stats_manager = _get_manager()
     
     # Récupérer seulement les repos
     repos = stats_manager.get_all_repos()
@@ -112,9 +126,9 @@ def example_specific_stats():
 
 def example_cache_usage():
     """Exemple d'utilisation du cache"""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("EXEMPLE 4 : Gestion du Cache")
-    print("=" * 70)
+    print(_SEP)
     
     cache = CacheManager('.cache')
     
@@ -131,12 +145,12 @@ def example_cache_usage():
     # Informations sur le cache
     info = cache.get_cache_info()
     print(f"\n📊 Informations du cache:")
-    print(f"   Fichiers: {info['total_files']}")
+    print(f"   Entrées: {info['total_files']}")
     print(f"   Taille: {info['total_size_mb']} MB")
     
     # Nettoyer le cache
     count = cache.clear()
-    print(f"\n🧹 {count} fichier(s) supprimé(s)")
+    print(f"\n🧹 {count} entrée(s) supprimée(s)")
 
 
 # ============================================================================
@@ -145,22 +159,24 @@ def example_cache_usage():
 
 def example_rate_limit():
     """Exemple de gestion du rate limit"""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("EXEMPLE 5 : Rate Limit")
-    print("=" * 70)
+    print(_SEP)
     
     headers = {
         'Authorization': 'token ghp_your_token_here',
         'Accept': 'application/vnd.github.v3+json'
     }
     
-    limiter = RateLimitHandler(headers)
+    # Réutiliser la session HTTP de l'instance partagée
+    limiter = RateLimitHandler(headers, session=_get_manager().session)
     
-    # Vérifier le rate limit
+    # Vérifier le rate limit (quota principal + quota de recherche)
     rate_info = limiter.check_rate_limit()
+    search_info = limiter.get_search_rate_info()
     print(f"\n📊 État du Rate Limit:")
-    print(f"   Restantes: {rate_info['remaining']}/{rate_info['limit']}")
-    print(f"   Reset à: {rate_info['reset_datetime'].strftime('%H:%M:%S')}")
+    print(f"   Core    : {rate_info['remaining']}/{rate_info['limit']} (reset à {rate_info['reset_datetime'].strftime('%H:%M:%S')})")
+    print(f"   Search  : {search_info['remaining']}/{search_info['limit']} (reset à {search_info['reset_datetime'].strftime('%H:%M:%S')})")
     
     # Attendre si nécessaire
     waited = limiter.wait_if_needed()
@@ -176,9 +192,9 @@ def example_rate_limit():
 
 def example_custom_readme():
     """Exemple de génération de README personnalisé"""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("EXEMPLE 6 : README Personnalisé")
-    print("=" * 70)
+    print(_SEP)
     
     # Configurer les sections à inclure
     config = Config()
@@ -207,23 +223,18 @@ def example_custom_readme():
 
 def example_export_json():
     """Exemple d'export des statistiques en JSON"""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("EXEMPLE 7 : Export JSON")
-    print("=" * 70)
+    print(_SEP)
     
-    stats_manager = GitHubStatsPrivate(
-        token='ghp_your_token_here',
-        username='your_username'
-    )
+    stats_manager = _get_manager()
     
     stats = stats_manager.calculate_all_stats()
     
-    # Sauvegarder en JSON
+    # Sauvegarder en JSON (orjson si disponible, sinon écriture en flux)
     output_file = 'stats/github_stats.json'
     Path('stats').mkdir(exist_ok=True)
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(stats, f, indent=2, ensure_ascii=False)
+    write_json(stats, output_file)
     
     print(f"\n✅ Statistiques exportées dans {output_file}")
     print(f"📊 Taille du fichier: {Path(output_file).stat().st_size} bytes")
@@ -235,14 +246,11 @@ def example_export_json():
 
 def example_language_analysis():
     """Exemple d'analyse détaillée des langages"""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("EXEMPLE 8 : Analyse des Langages")
-    print("=" * 70)
+    print(_SEP)
     
-    stats_manager = GitHubStatsPrivate(
-        token='ghp_your_token_here',
-        username='your_username'
-    )
+    stats_manager = _get_manager()
     
     repos = stats_manager.get_all_repos()
     languages = stats_manager.get_language_stats(repos)
@@ -250,11 +258,12 @@ def example_language_analysis():
     print("\n💻 Répartition des langages:")
     print("=" * 50)
     
-    for lang, percentage in languages.items():
-        # Créer une barre visuelle
-        bar_length = int(percentage / 2)
-        bar = '█' * bar_length
-        print(f"{lang:<20} {bar} {percentage:.1f}%")
+    # Une barre visuelle par langage, écrites en une seule fois
+    lines = [
+        f"{lang:<20} {'█' * int(percentage / 2)} {percentage:.1f}%"
+        for lang, percentage in languages.items()
+    ]
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 # ============================================================================
@@ -263,9 +272,9 @@ def example_language_analysis():
 
 def example_activity_heatmap():
     """Exemple de génération de heatmap d'activité"""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("EXEMPLE 9 : Heatmap d'Activité")
-    print("=" * 70)
+    print(_SEP)
     
     config = Config()
     config.set('stats.include_heatmap', True)
@@ -279,18 +288,12 @@ def example_activity_heatmap():
     repos = stats_manager.get_all_repos()
     heatmap = stats_manager.get_activity_heatmap(repos)
     
-    # Trouver l'heure la plus active
-    max_commits = 0
-    max_day = 0
-    max_hour = 0
-    
-    for day in range(7):
-        for hour in range(24):
-            commits = heatmap.get(day, {}).get(hour, 0)
-            if commits > max_commits:
-                max_commits = commits
-                max_day = day
-                max_hour = hour
+    # Trouver l'heure la plus active (un seul passage sur les cellules)
+    max_day, max_hour, max_commits = max(
+        ((day, hour, count) for day, hours in heatmap.items() for hour, count in hours.items()),
+        key=lambda cell: cell[2],
+        default=(0, 0, 0)
+    )
     
     days = ['Lundi', 'Mardi', 'Mercredi', 'Jeudi', 'Vendredi', 'Samedi', 'Dimanche']
     print(f"\n🔥 Période la plus active:")
@@ -303,14 +306,11 @@ def example_activity_heatmap():
 
 def example_dry_run():
     """Exemple de mode dry-run pour tester sans publier"""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("EXEMPLE 10 : Mode Dry-Run")
-    print("=" * 70)
+    print(_SEP)
     
-    stats_manager = GitHubStatsPrivate(
-        token='ghp_your_token_here',
-        username='your_username'
-    )
+    stats_manager = _get_manager()
     
     # Calculer les stats
     stats = stats_manager.calculate_all_stats()
@@ -320,14 +320,15 @@ def example_dry_run():
     
     # Afficher un aperçu au lieu de publier
     print("\n📝 Aperçu du README (50 premières lignes):")
-    print("=" * 70)
+    print(_SEP)
     
-    lines = readme.split('\n')
-    for line in lines[:50]:
-        print(line)
+    # Lecture paresseuse: seules les 50 premières lignes sont extraites
+    buffer = io.StringIO(readme)
+    sys.stdout.write(''.join(itertools.islice(buffer, 50)).rstrip('\n') + '\n')
     
-    if len(lines) > 50:
-        print(f"\n... ({len(lines) - 50} lignes supplémentaires)")
+    remaining = sum(1 for _ in buffer)
+    if remaining:
+        print(f"\n... ({remaining} lignes supplémentaires)")
     
     print("\n✅ Mode dry-run : Aucune publication sur GitHub")
 
@@ -338,9 +339,9 @@ def example_dry_run():
 
 def main():
     """Exécute tous les exemples (commentez ceux que vous ne voulez pas)"""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("EXEMPLES D'UTILISATION - GITHUB STATS AUTOMATION".center(70))
-    print("=" * 70)
+    print(_SEP)
     
     print("\n⚠️  Note: Ces exemples nécessitent un token GitHub valide")
     print("   Modifiez les valeurs 'ghp_your_token_here' et 'your_username'")
@@ -359,9 +360,9 @@ def main():
     # example_activity_heatmap()
     # example_dry_run()
     
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("✅ Exemples terminés!")
-    print("=" * 70)
+    print(_SEP)
 
 
 if __name__ == '__main__':
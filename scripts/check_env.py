@@ -6,10 +6,15 @@ Script de Vérification de l'Environnement
 Vérifie que toutes les variables d'environnement requises sont correctement configurées.
 
 Usage:
-    python scripts/check_env.py
+    python scripts/check_env.py [--create-template]
+
+Options:
+    --create-template : Créer un fichier .env template s'il n'existe pas
+                        (sans question, utile en CI)
 """
 
 import sys
+import argparse
 from pathlib import Path
 
 # Ajouter le répertoire parent au path
@@ -25,13 +30,38 @@ from src.env_loader import (
 from src.utils import validate_github_token, validate_github_username
 import os
 
+# Ligne de séparation des sections
+_SEP = "=" * 70
+
+
+def parse_arguments():
+    """
+    Parse les arguments de la ligne de commande
+    
+    Returns:
+        Arguments parsés
+    """
+    parser = argparse.ArgumentParser(
+        description="Vérifie la configuration de l'environnement"
+    )
+    
+    parser.add_argument(
+        '--create-template',
+        action='store_true',
+        help="Créer un fichier .env template s'il n'existe pas (sans question)"
+    )
+    
+    return parser.parse_args()
+
 
 def main():
     """Vérifie la configuration de l'environnement"""
     
-    print("\n" + "=" * 70)
+    args = parse_arguments()
+    
+    print("\n" + _SEP)
     print("🔍 VÉRIFICATION DE L'ENVIRONNEMENT".center(70))
-    print("=" * 70)
+    print(_SEP)
     
     # 1. Chercher le fichier .env
     print("\n📁 Recherche du fichier .env...")
@@ -42,16 +72,20 @@ def main():
         load_dotenv(str(env_file))
     else:
         print("❌ Aucun fichier .env trouvé")
-        print("\n💡 Voulez-vous créer un fichier .env template? (o/n): ", end='')
         
-        try:
-            response = input().lower()
-            if response == 'o':
-                create_env_template()
-                print("\n⚠️  Éditez le fichier .env et relancez ce script")
-                return 1
-        except:
-            pass
+        # Ne poser la question qu'en mode interactif (pas de blocage en CI)
+        create = args.create_template
+        if not create and sys.stdin.isatty():
+            print("\n💡 Voulez-vous créer un fichier .env template? (o/n): ", end='')
+            try:
+                create = input().lower() == 'o'
+            except EOFError:
+                create = False
+        
+        if create:
+            create_env_template()
+            print("\n⚠️  Éditez le fichier .env et relancez ce script")
+            return 1
     
     # 2. Vérifier les variables requises
     print("\n🔐 Vérification des variables requises...")
@@ -97,14 +131,15 @@ def main():
     # 6. Test de connexion (basique)
     print("\n🌐 Test de connexion à l'API GitHub...")
     try:
-        import requests
+        from src.http_client import create_session
         
-        headers = {
+        # Une seule session: /rate_limit réutilise la connexion de /user
+        session = create_session(headers={
             'Authorization': f'token {token}',
             'Accept': 'application/vnd.github.v3+json'
-        }
+        })
         
-        response = requests.get('https://api.github.com/user', headers=headers, timeout=10)
+        response = session.get('https://api.github.com/user', timeout=10)
         
         if response.status_code == 200:
             user_data = response.json()
@@ -114,13 +149,18 @@ def main():
             print(f"   Repos publics: {user_data['public_repos']}")
             print(f"   Repos privés: {user_data.get('total_private_repos', 0)}")
             
-            # Vérifier le rate limit
-            rate_response = requests.get('https://api.github.com/rate_limit', headers=headers, timeout=10)
-            if rate_response.status_code == 200:
-                rate_data = rate_response.json()
-                core = rate_data['resources']['core']
+            # Vérifier le rate limit (en-têtes de /user, sinon /rate_limit)
+            remaining = response.headers.get('X-RateLimit-Remaining')
+            limit = response.headers.get('X-RateLimit-Limit')
+            if remaining is None or limit is None:
+                rate_response = session.get('https://api.github.com/rate_limit', timeout=10)
+                if rate_response.status_code == 200:
+                    core = rate_response.json()['resources']['core']
+                    remaining, limit = core['remaining'], core['limit']
+            
+            if remaining is not None:
                 print(f"\n📊 Rate Limit:")
-                print(f"   Restantes: {core['remaining']}/{core['limit']}")
+                print(f"   Restantes: {remaining}/{limit}")
         
         elif response.status_code == 401:
             print("❌ Authentification échouée")
@@ -136,15 +176,15 @@ def main():
         print("   Vérifiez votre connexion Internet")
     
     # 7. Résumé final
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("📋 RÉSUMÉ".center(70))
-    print("=" * 70)
+    print(_SEP)
     
     if all_present and validate_github_token(token) and validate_github_username(username):
         print("\n✅ Votre environnement est correctement configuré!")
         print("\n🚀 Vous pouvez maintenant exécuter:")
         print("   python scripts/update_stats.py --dry-run")
-        print("\n" + "=" * 70)
+        print("\n" + _SEP)
         return 0
     else:
         print("\n⚠️  Votre environnement nécessite des corrections")
@@ -159,7 +199,7 @@ def main():
         if not validate_github_username(username):
             print("   3. Vérifiez le format de votre GITHUB_USERNAME")
         
-        print("\n" + "=" * 70)
+        print("\n" + _SEP)
         return 1
 
 
@@ -33,8 +33,8 @@ Exemples:
 
 import os
 import sys
-import json
 import argparse
+import itertools
 from pathlib import Path
 from datetime import datetime
 
@@ -53,9 +53,13 @@ else:
     print("⚠️  Aucun fichier .env trouvé (utilisation des variables d'environnement système)")
 
 from src.config import Config
-from src.github_stats import GitHubStatsPrivate
-from src.cache_manager import CacheManager
-from src.utils import format_number, validate_github_token, validate_github_username
+from src.utils import format_number, validate_github_token, validate_github_username, write_json
+
+# Gabarits du résumé (print_summary)
+_SEP = "=" * 70
+_SUMMARY_SECTION = "\n{:<40}"
+_SUMMARY_ROW = "   {:<21}: {:>15}"
+_SUMMARY_LANGUAGE = "   {}. {:<25} : {:>10.1f}%"
 
 
 def parse_arguments():
@@ -177,47 +181,57 @@ def print_summary(stats: dict):
     Args:
         stats: Dictionnaire des statistiques
     """
-    print("\n" + "=" * 70)
-    print("📊 RÉSUMÉ DES STATISTIQUES".center(70))
-    print("=" * 70)
-
-    print(f"\n{'📦 DÉPÔTS':<40}")
-    print(f"   Total                : {format_number(stats['total_repos']):>15}")
-    print(f"   └─ Publics           : {format_number(stats['public_repos']):>15}")
-    print(f"   └─ Privés            : {format_number(stats['private_repos']):>15}")
-
-    print(f"\n{'⭐ ÉTOILES':<40}")
-    print(f"   Total                : {format_number(stats['stars']):>15}")
-    
-    print(f"\n{'📝 COMMITS':<40}")
-    print(f"   Derniers {stats['period_days']} jours   : {format_number(stats['commits_last_year']):>15}")
-    
-    print(f"\n{'🔀 PULL REQUESTS':<40}")
-    print(f"   Total                : {format_number(stats['prs']['total']):>15}")
-    print(f"   ├─ Ouvertes          : {format_number(stats['prs']['open']):>15}")
-    print(f"   ├─ Mergées           : {format_number(stats['prs']['merged']):>15}")
-    print(f"   └─ Fermées           : {format_number(stats['prs']['closed']):>15}")
-    
-    print(f"\n{'❗ ISSUES':<40}")
-    print(f"   Total                : {format_number(stats['issues']['total']):>15}")
-    print(f"   ├─ Ouvertes          : {format_number(stats['issues']['open']):>15}")
-    print(f"   └─ Fermées           : {format_number(stats['issues']['closed']):>15}")
-    
-    if stats['code_changes']['total_changes'] > 0:
-        print(f"\n{'💻 MODIFICATIONS DE CODE':<40}")
-        print(f"   Lignes ajoutées      : {format_number(stats['code_changes']['additions']):>15}")
-        print(f"   Lignes supprimées    : {format_number(stats['code_changes']['deletions']):>15}")
-        print(f"   Total modifications  : {format_number(stats['code_changes']['total_changes']):>15}")
+    prs = stats['prs']
+    issues = stats['issues']
+    code_changes = stats['code_changes']
+    
+    out = [
+        "\n" + _SEP,
+        "📊 RÉSUMÉ DES STATISTIQUES".center(70),
+        _SEP,
+        _SUMMARY_SECTION.format('📦 DÉPÔTS'),
+        _SUMMARY_ROW.format('Total', format_number(stats['total_repos'])),
+        _SUMMARY_ROW.format('└─ Publics', format_number(stats['public_repos'])),
+        _SUMMARY_ROW.format('└─ Privés', format_number(stats['private_repos'])),
+        _SUMMARY_SECTION.format('⭐ ÉTOILES'),
+        _SUMMARY_ROW.format('Total', format_number(stats['stars'])),
+        _SUMMARY_SECTION.format('📝 COMMITS'),
+        _SUMMARY_ROW.format(f"Derniers {stats['period_days']} jours", format_number(stats['commits_last_year'])),
+        _SUMMARY_SECTION.format('🔀 PULL REQUESTS'),
+        _SUMMARY_ROW.format('Total', format_number(prs['total'])),
+        _SUMMARY_ROW.format('├─ Ouvertes', format_number(prs['open'])),
+        _SUMMARY_ROW.format('├─ Mergées', format_number(prs['merged'])),
+        _SUMMARY_ROW.format('└─ Fermées', format_number(prs['closed'])),
+        _SUMMARY_SECTION.format('❗ ISSUES'),
+        _SUMMARY_ROW.format('Total', format_number(issues['total'])),
+        _SUMMARY_ROW.format('├─ Ouvertes', format_number(issues['open'])),
+        _SUMMARY_ROW.format('└─ Fermées', format_number(issues['closed']))
+    ]
+    
+    if code_changes['total_changes'] > 0:
+        out += [
+            _SUMMARY_SECTION.format('💻 MODIFICATIONS DE CODE'),
+            _SUMMARY_ROW.format('Lignes ajoutées', format_number(code_changes['additions'])),
+            _SUMMARY_ROW.format('Lignes supprimées', format_number(code_changes['deletions'])),
+            _SUMMARY_ROW.format('Total modifications', format_number(code_changes['total_changes']))
+        ]
     
     if stats['languages']:
-        print(f"\n{'💻 TOP 5 LANGAGES':<40}")
-        for i, (lang, percent) in enumerate(list(stats['languages'].items())[:5], 1):
-            print(f"   {i}. {lang:<25} : {percent:>10.1f}%")
-    
-    print(f"\n{'🤝 CONTRIBUTIONS':<40}")
-    print(f"   Repos contribués     : {format_number(stats['contributed_repos']):>15}")
-    
-    print("\n" + "=" * 70)
+        out.append(_SUMMARY_SECTION.format('💻 TOP 5 LANGAGES'))
+        out += [
+            _SUMMARY_LANGUAGE.format(i, lang, percent)
+            for i, (lang, percent) in enumerate(itertools.islice(stats['languages'].items(), 5), 1)
+        ]
+    
+    out += [
+        _SUMMARY_SECTION.format('🤝 CONTRIBUTIONS'),
+        _SUMMARY_ROW.format('Repos contribués', format_number(stats['contributed_repos'])),
+        "\n" + _SEP
+    ]
+    
+    # Une seule écriture pour tout le résumé
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
 
 
 def save_stats_to_json(stats: dict, filepath: str):
@@ -232,11 +246,7 @@ def save_stats_to_json(stats: dict, filepath: str):
         output_path = Path(filepath)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Convertir les données non-sérialisables
-        stats_copy = dict(stats)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(stats_copy, f, indent=2, ensure_ascii=False)
+        write_json(stats, output_path)
         
         print(f"✅ Statistiques sauvegardées dans: {filepath}")
     
@@ -327,21 +337,26 @@ def main():
     
     # Nettoyer le cache si demandé
     if args.clear_cache:
+        from src.cache_manager import CacheManager
+        
         cache = CacheManager(config.get('cache.directory', '.cache'))
         count = cache.clear()
-        print(f"🧹 Cache nettoyé: {count} fichier(s) supprimé(s)")
+        print(f"🧹 Cache nettoyé: {count} entrée(s) supprimée(s)")
     
-    # Initialiser le gestionnaire de stats
+    # Initialiser le gestionnaire de stats (import tardif: requests n'est
+    # chargé que si des statistiques sont réellement calculées)
     try:
+        from src.github_stats import GitHubStatsPrivate
+        
         stats_manager = GitHubStatsPrivate(token, username, config)
     except Exception as e:
         print(f"❌ Erreur lors de l'initialisation: {e}")
         return 1
     
     # Calculer les statistiques
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("🔍 RÉCUPÉRATION DES STATISTIQUES...")
-    print("=" * 70 + "\n")
+    print(_SEP + "\n")
     
     try:
         stats = stats_manager.calculate_all_stats()
@@ -373,9 +388,9 @@ def main():
     
     # Mode dry-run
     if args.dry_run:
-        print("\n" + "=" * 70)
+        print("\n" + _SEP)
         print("🔍 MODE DRY-RUN - Aperçu du README:".center(70))
-        print("=" * 70)
+        print(_SEP)
         
         # Afficher les 30 premières lignes
         lines = readme_content.split('\n')
@@ -385,9 +400,9 @@ def main():
         if len(lines) > 30:
             print(f"\n... ({len(lines) - 30} lignes supplémentaires)")
         
-        print("\n" + "=" * 70)
+        print("\n" + _SEP)
         print("ℹ️  Mode dry-run: Le README n'a PAS été publié sur GitHub")
-        print("=" * 70)
+        print(_SEP)
         return 0
     
     # Publier sur GitHub
@@ -396,13 +411,13 @@ def main():
     try:
         result = stats_manager.update_profile_readme(readme_content)
         
-        print("\n" + "=" * 70)
+        print("\n" + _SEP)
         print("✅ SUCCÈS !".center(70))
-        print("=" * 70)
+        print(_SEP)
         print(f"\n🔗 Voir votre profil: https://github.com/{username}")
         print(f"📝 README mis à jour avec succès")
         print(f"🕐 Dernière mise à jour: {datetime.now().strftime('%d/%m/%Y à %H:%M:%S')}")
-        print("\n" + "=" * 70)
+        print("\n" + _SEP)
         
         return 0
     
@@ -12,23 +12,62 @@ Modules:
     - github_stats: Classe principale pour récupérer les statistiques
     - utils: Fonctions utilitaires diverses
     - env_loader: Chargement automatique du fichier .env
+    - http_client: Sessions HTTP partagées (keep-alive, nouvelles tentatives)
 """
 
 __version__ = '1.0.0'
 __author__ = 'GitHub Stats Team'
 
-from .cache_manager import CacheManager
-from .rate_limiter import RateLimitHandler
-from .config import Config
-from .github_stats import GitHubStatsPrivate
+import importlib
+
+# Importé immédiatement: charge le .env à l'import du package
 from .env_loader import load_dotenv, find_dotenv
 
+# Autres symboles importés à la première utilisation (PEP 562): importer
+# src ou src.env_loader ne charge ni requests ni yaml
+_LAZY_EXPORTS = {
+    'CacheManager': 'cache_manager',
+    'RateLimitHandler': 'rate_limiter',
+    'Config': 'config',
+    'GitHubStatsPrivate': 'github_stats',
+    'SESSION': 'http_client',
+    'create_session': 'http_client'
+}
+
 __all__ = [
     'CacheManager',
     'RateLimitHandler',
     'Config',
     'GitHubStatsPrivate',
     'load_dotenv',
-    'find_dotenv'
+    'find_dotenv',
+    'SESSION',
+    'create_session'
 ]
 
+
+def __getattr__(name):
+    """
+    Importe à la demande les symboles de _LAZY_EXPORTS
+    
+    Args:
+        name: Nom du symbole demandé
+    
+    Returns:
+        Le symbole, mis en cache dans le module
+    
+    Raises:
+        AttributeError: Si le symbole n'existe pas
+    """
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Liste aussi les symboles pas encore importés"""
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
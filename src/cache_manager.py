@@ -6,70 +6,247 @@ Cache Manager Module
 Ce module gère le système de cache pour optimiser les requêtes API GitHub.
 
 Fonctionnalités:
-- Stockage des données API en JSON
+- Stockage des données API dans une base SQLite unique (cache.db)
 - Vérification de la validité du cache basée sur le temps
+- Stockage des ETag pour les requêtes conditionnelles
 - Nettoyage automatique du cache
-- Utilisation de hash MD5 pour les clés de cache
+- Index des clés en mémoire: un cache miss ne touche pas la base
+- Entrées récentes gardées décodées en mémoire (LRU)
+- Compression zlib des entrées volumineuses
+- Utilisation de hash BLAKE2b pour les clés de cache
 
 Avantages:
 - Réduit le nombre de requêtes API
 - Accélère les exécutions répétées
 - Respecte les limites de rate limit de GitHub
+- Un seul fichier ouvert quel que soit le nombre d'entrées
 """
 
+import os
 import json
+import time
+import sqlite3
 import hashlib
+import threading
+import zlib
+from collections import OrderedDict
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Set, Tuple
+
+from .utils import json_dumps, json_loads
+
+# Version du format des clés (PRAGMA user_version): 1 = BLAKE2b
+KEY_FORMAT = 1
+
+# Nombre d'entrées décodées gardées en mémoire
+MEMORY_ENTRIES = 256
+
+# Taille à partir de laquelle une entrée est compressée (zlib)
+COMPRESS_MIN_BYTES = 16 * 1024
+
+# Taille maximale de la base projetée en mémoire (PRAGMA mmap_size)
+MMAP_SIZE = 64 * 1024 * 1024
 
 
 class CacheManager:
     """
     Gestionnaire de cache pour les données API GitHub
     
-    Le cache est stocké dans des fichiers JSON avec une durée de validité.
-    Chaque entrée de cache a une clé unique générée par hash MD5.
+    Le cache est stocké dans une base SQLite (mode WAL) avec une date de
+    création par entrée. Chaque entrée a une clé unique générée par hash BLAKE2b (128 bits).
+    
+    Schéma: cache(key TEXT PRIMARY KEY, value BLOB, etag TEXT, created REAL)
+    
+    Les clés présentes sont aussi gardées en mémoire (chargées à
+    l'ouverture) pour répondre aux absences sans interroger la base.
     
     Attributes:
         cache_dir (Path): Répertoire de stockage du cache
+        db_path (Path): Chemin de la base SQLite
     """
     
+    # Répertoires déjà préparés (mkdir + .gitignore) dans ce processus
+    _initialized_dirs: Set[Path] = set()
+    
     def __init__(self, cache_dir: str = '.cache'):
         """
         Initialise le gestionnaire de cache
         
         Args:
-            cache_dir: Répertoire où stocker les fichiers de cache
+            cache_dir: Répertoire où stocker la base de cache
         """
         self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(exist_ok=True)
         
-        # Créer un fichier .gitignore pour ne pas versionner le cache
-        gitignore_path = self.cache_dir / '.gitignore'
-        if not gitignore_path.exists():
-            with open(gitignore_path, 'w') as f:
-                f.write('*\n!.gitignore\n')
+        # Préparer le répertoire une seule fois par processus
+        if self.cache_dir not in CacheManager._initialized_dirs:
+            self.cache_dir.mkdir(exist_ok=True)
+            
+            # Créer un fichier .gitignore pour ne pas versionner le cache
+            # (mode 'x': un seul appel système, échoue si le fichier existe)
+            try:
+                with open(self.cache_dir / '.gitignore', 'x') as f:
+                    f.write('*\n!.gitignore\n')
+            except FileExistsError:
+                pass
+            
+            CacheManager._initialized_dirs.add(self.cache_dir)
+        
+        # Base SQLite unique (autocommit, WAL), partagée entre threads
+        self.db_path = self.cache_dir / 'cache.db'
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), isolation_level=None, check_same_thread=False)
+        self._execute('PRAGMA journal_mode=WAL')
+        self._execute('PRAGMA synchronous=NORMAL')
+        # Lectures par mmap: les pages sont lues depuis le cache du noyau
+        # sans copie intermédiaire (read()) dans SQLite
+        self._execute(f'PRAGMA mmap_size={MMAP_SIZE}')
+        self._execute(
+            'CREATE TABLE IF NOT EXISTS cache ('
+            'key TEXT PRIMARY KEY, value BLOB, etag TEXT, created REAL)'
+        )
+        
+        # Entrées indexées par hash MD5 (format précédent): inaccessibles
+        with self._lock:
+            key_format = self._conn.execute('PRAGMA user_version').fetchone()[0]
+        if key_format < KEY_FORMAT:
+            self._execute('DELETE FROM cache')
+            self._execute(f'PRAGMA user_version = {KEY_FORMAT}')
+        
+        # Clés présentes en base, chargées une fois: les absences sont
+        # détectées sans requête SQL
+        with self._lock:
+            self._keys = {row[0] for row in self._conn.execute('SELECT key FROM cache')}
+        
+        # Entrées décodées récemment utilisées (voir _load)
+        self._mem = OrderedDict()
+        self._mem_lock = threading.Lock()
+    
+    def _execute(self, sql: str, params: tuple = ()) -> int:
+        """
+        Exécute une requête d'écriture sous verrou
+        
+        Args:
+            sql: Requête SQL
+            params: Paramètres de la requête
+        
+        Returns:
+            Nombre de lignes affectées
+        """
+        with self._lock:
+            return self._conn.execute(sql, params).rowcount
+    
+    def _fetch_one(self, sql: str, params: tuple = ()) -> Optional[tuple]:
+        """
+        Exécute une requête de lecture sous verrou
+        
+        Args:
+            sql: Requête SQL
+            params: Paramètres de la requête
+        
+        Returns:
+            Première ligne du résultat ou None
+        """
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()
+    
+    def _delete_key(self, cache_key: str) -> int:
+        """
+        Supprime une entrée de la base et de l'index des clés
+        
+        Args:
+            cache_key: Clé hachée de l'entrée
+        
+        Returns:
+            Nombre de lignes supprimées
+        """
+        self._keys.discard(cache_key)
+        with self._mem_lock:
+            self._mem.pop(cache_key, None)
+        return self._execute('DELETE FROM cache WHERE key = ?', (cache_key,))
     
     def _get_cache_key(self, key: str) -> str:
         """
         Génère une clé de cache sécurisée à partir d'une chaîne
         
-        Utilise MD5 pour créer un nom de fichier court et unique.
+        Utilise BLAKE2b (digest de 16 octets) pour créer une clé courte et
+        de longueur fixe: plus rapide que MD5, et disponible même lorsque
+        MD5 est désactivé (FIPS).
         
         Args:
             key: La clé originale (ex: 'repos_username')
         
         Returns:
-            Hash MD5 de la clé
+            Hash BLAKE2b de la clé (32 caractères hexadécimaux)
+        """
+        return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    
+    def _load(self, cache_key: str) -> Optional[tuple]:
+        """
+        Charge une entrée, depuis la mémoire si possible
+        
+        Les entrées lues ou écrites récemment sont gardées décodées en
+        mémoire (LRU de MEMORY_ENTRIES entrées): une lecture répétée
+        n'interroge pas la base et ne redécode pas le JSON. Les données
+        retournées sont donc partagées entre appels: ne pas les modifier.
+        
+        Args:
+            cache_key: Clé hachée de l'entrée
+        
+        Returns:
+            Tuple (données, etag, created) ou None si inexistant
+        """
+        if cache_key not in self._keys:
+            return None
+        
+        with self._mem_lock:
+            entry = self._mem.get(cache_key)
+            if entry is not None:
+                self._mem.move_to_end(cache_key)
+                return entry
+        
+        row = self._fetch_one(
+            'SELECT value, etag, created FROM cache WHERE key = ?', (cache_key,)
+        )
+        
+        if row is None:
+            return None
+        
+        value = row[0]
+        
+        try:
+            # Entrée compressée: un document JSON ne commence jamais par 'x'
+            # (0x78, premier octet d'un flux zlib)
+            if value[:1] == b'x':
+                value = zlib.decompress(value)
+            entry = (json_loads(value),) + tuple(row[1:])
+        except (json.JSONDecodeError, TypeError, zlib.error) as e:
+            print(f"⚠️  Erreur lecture cache: {e}")
+            # Supprimer l'entrée corrompue
+            self._delete_key(cache_key)
+            return None
+        
+        self._remember(cache_key, entry)
+        return entry
+    
+    def _remember(self, cache_key: str, entry: tuple):
         """
-        return hashlib.md5(key.encode()).hexdigest()
+        Garde une entrée décodée en mémoire (éviction LRU)
+        
+        Args:
+            cache_key: Clé hachée de l'entrée
+            entry: Tuple (données, etag, created)
+        """
+        with self._mem_lock:
+            self._mem[cache_key] = entry
+            self._mem.move_to_end(cache_key)
+            if len(self._mem) > MEMORY_ENTRIES:
+                self._mem.popitem(last=False)
     
     def get(self, key: str, max_age_hours: int = 24) -> Optional[Any]:
         """
         Récupère une donnée depuis le cache si elle est valide
         
-        Vérifie l'âge du fichier de cache. Si trop ancien, retourne None.
+        Vérifie l'âge de l'entrée. Si trop ancienne, la supprime et retourne None.
         
         Args:
             key: Clé de la donnée à récupérer
@@ -84,30 +261,21 @@ class CacheManager:
             >>> if data:
             ...     print("Données en cache!")
         """
-        cache_file = self.cache_dir / f"{self._get_cache_key(key)}.json"
+        cache_key = self._get_cache_key(key)
+        entry = self._load(cache_key)
         
-        # Vérifier si le fichier existe
-        if not cache_file.exists():
+        if entry is None:
             return None
         
-        # Vérifier l'âge du fichier
-        file_mod_time = datetime.fromtimestamp(cache_file.stat().st_mtime)
-        file_age = datetime.now() - file_mod_time
+        data, _, created = entry
         
-        if file_age > timedelta(hours=max_age_hours):
+        # Vérifier l'âge de l'entrée
+        if time.time() - created > max_age_hours * 3600:
             # Cache périmé, le supprimer
-            cache_file.unlink()
+            self._delete_key(cache_key)
             return None
         
-        # Charger et retourner les données
-        try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"⚠️  Erreur lecture cache: {e}")
-            # Supprimer le fichier corrompu
-            cache_file.unlink()
-            return None
+        return data
     
     def set(self, key: str, data: Any) -> bool:
         """
@@ -124,13 +292,97 @@ class CacheManager:
             >>> cache = CacheManager()
             >>> cache.set('repos_user123', {'repos': [...]})
         """
-        cache_file = self.cache_dir / f"{self._get_cache_key(key)}.json"
+        return self._write(key, data, None)
+    
+    def get_with_etag(self, key: str) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        Récupère une donnée et son ETag, sans vérifier l'âge
+        
+        Destiné aux requêtes conditionnelles (If-None-Match): une entrée
+        ancienne reste utile tant que GitHub répond 304 Not Modified.
+        
+        Args:
+            key: Clé de la donnée à récupérer
+        
+        Returns:
+            Tuple (données, etag) ou (None, None) si inexistant
+        """
+        entry = self._load(self._get_cache_key(key))
+        
+        if entry is None or entry[1] is None:
+            return None, None
+        
+        return entry[0], entry[1]
+    
+    def set_with_etag(self, key: str, data: Any, etag: str) -> bool:
+        """
+        Sauvegarde une donnée avec l'ETag de la réponse HTTP
+        
+        Args:
+            key: Clé pour identifier la donnée
+            data: Donnée à sauvegarder (doit être sérialisable en JSON)
+            etag: Valeur de l'en-tête ETag
+        
+        Returns:
+            True si succès, False sinon
+        """
+        return self._write(key, data, etag)
+    
+    def touch(self, key: str) -> bool:
+        """
+        Marque une entrée comme revalidée, sans réécrire ses données
+        
+        À appeler quand le serveur répond 304 Not Modified: la date de
+        création repart de maintenant.
+        
+        Args:
+            key: Clé de l'entrée
+        
+        Returns:
+            True si l'entrée existait
+        """
+        cache_key = self._get_cache_key(key)
+        if cache_key not in self._keys:
+            return False
+        
+        now = time.time()
+        updated = self._execute(
+            'UPDATE cache SET created = ? WHERE key = ?', (now, cache_key)
+        )
+        
+        with self._mem_lock:
+            entry = self._mem.get(cache_key)
+            if entry is not None:
+                self._mem[cache_key] = (entry[0], entry[1], now)
+        
+        return updated > 0
+    
+    def _write(self, key: str, data: Any, etag: Optional[str]) -> bool:
+        """
+        Insère ou remplace une entrée du cache
+        
+        Args:
+            key: Clé pour identifier la donnée
+            data: Donnée à sauvegarder
+            etag: ETag associé (ou None)
         
+        Returns:
+            True si succès, False sinon
+        """
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            value = json_dumps(data)
+            if len(value) >= COMPRESS_MIN_BYTES:
+                value = zlib.compress(value, 1)
+            now = time.time()
+            cache_key = self._get_cache_key(key)
+            self._execute(
+                'INSERT OR REPLACE INTO cache (key, value, etag, created) VALUES (?, ?, ?, ?)',
+                (cache_key, value, etag, now)
+            )
+            self._keys.add(cache_key)
+            self._remember(cache_key, (data, etag, now))
             return True
-        except (TypeError, IOError) as e:
+        except (TypeError, ValueError, sqlite3.Error) as e:
             print(f"⚠️  Erreur écriture cache: {e}")
             return False
     
@@ -144,51 +396,61 @@ class CacheManager:
         Returns:
             True si supprimé, False si n'existait pas
         """
-        cache_file = self.cache_dir / f"{self._get_cache_key(key)}.json"
-        
-        if cache_file.exists():
-            cache_file.unlink()
-            return True
-        return False
+        return self._delete_key(self._get_cache_key(key)) > 0
     
     def clear(self) -> int:
         """
         Nettoie tout le cache
         
-        Supprime tous les fichiers .json du répertoire de cache.
+        Supprime toutes les entrées de la base de cache, puis compacte
+        la base (VACUUM) et vide le journal WAL pour rendre l'espace disque
+        libéré.
         
         Returns:
-            Nombre de fichiers supprimés
+            Nombre d'entrées supprimées
         
         Example:
             >>> cache = CacheManager()
             >>> count = cache.clear()
-            >>> print(f"{count} fichiers supprimés")
+            >>> print(f"{count} entrées supprimées")
         """
-        count = 0
-        for cache_file in self.cache_dir.glob('*.json'):
-            try:
-                cache_file.unlink()
-                count += 1
-            except OSError:
-                pass
+        self._keys.clear()
+        with self._mem_lock:
+            self._mem.clear()
         
+        count = self._execute('DELETE FROM cache')
+        self._execute('VACUUM')
+        self._execute('PRAGMA wal_checkpoint(TRUNCATE)')
         return count
     
     def get_cache_info(self) -> Dict[str, Any]:
         """
         Obtient des informations sur l'état du cache
         
+        Le nombre d'entrées vient de l'index des clés en mémoire, la taille
+        est l'occupation disque réelle (base, journal WAL...) lue en un seul
+        parcours du répertoire (os.scandir).
+        
         Returns:
             Dictionnaire avec statistiques du cache
         """
-        files = list(self.cache_dir.glob('*.json'))
-        total_size = sum(f.stat().st_size for f in files)
+        with os.scandir(self.cache_dir) as entries:
+            total_size = sum(
+                entry.stat(follow_symlinks=False).st_size
+                for entry in entries
+                if entry.is_file(follow_symlinks=False)
+            )
         
         return {
-            'total_files': len(files),
+            'total_files': len(self._keys),
             'total_size_bytes': total_size,
             'total_size_mb': round(total_size / (1024 * 1024), 2),
             'cache_directory': str(self.cache_dir.absolute())
         }
-
+    
+    def close(self):
+        """
+        Ferme la connexion à la base de cache
+        """
+        with self._lock:
+            self._conn.close()
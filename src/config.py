@@ -19,10 +19,213 @@ La configuration permet de personnaliser:
 """
 
 import os
+import copy
+import logging
+import marshal
 import yaml
+from functools import lru_cache
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Dict, Any, Optional
 
+# Parseur/émetteur C (libyaml) si disponible, sinon implémentation Python
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+# Logger enfant de 'GitHubStats': hérite de ses handlers une fois configuré
+logger = logging.getLogger('GitHubStats.config')
+
+
+# Suffixe du fichier compagnon contenant la configuration déjà parsée
+PARSED_SUFFIX = '.marshal'
+
+
+@lru_cache(maxsize=32)
+def _parse_config_file(config_file: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Lit et parse un fichier de configuration YAML (résultat mis en cache)
+    
+    Le résultat est aussi conservé entre les exécutions dans un fichier
+    compagnon (config.yaml.marshal), relu tel quel tant que la date de
+    modification et la taille du YAML n'ont pas changé.
+    
+    Args:
+        config_file: Chemin absolu du fichier
+        mtime_ns: Date de modification, clé d'invalidation du cache
+        size: Taille du fichier, clé d'invalidation du cache
+    
+    Returns:
+        Configuration brute, sans surcharges d'environnement (ne pas modifier)
+    
+    Raises:
+        yaml.YAMLError: Si le fichier est invalide (non mis en cache)
+    """
+    parsed_file = config_file + PARSED_SUFFIX
+    
+    try:
+        with open(parsed_file, 'rb') as f:
+            cached_mtime, cached_size, data = marshal.load(f)
+        if (cached_mtime, cached_size) == (mtime_ns, size) and isinstance(data, dict):
+            return data
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    
+    # Lecture en un seul appel; libyaml décode l'UTF-8 lui-même
+    data = yaml.load(Path(config_file).read_bytes(), Loader=_Loader) or {}
+    
+    # Écriture atomique; ignorée si le répertoire est en lecture seule
+    # ou si le YAML contient des types non sérialisables (dates...)
+    tmp_file = f"{parsed_file}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, 'wb') as f:
+            marshal.dump((mtime_ns, size, data), f)
+        os.replace(tmp_file, parsed_file)
+    except (OSError, ValueError):
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+    
+    return data
+
+
+# Configuration par défaut (token et username complétés depuis l'environnement)
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    'github': {
+        'token': '',
+        'username': '',
+        'api_url': 'https://api.github.com'
+    },
+    
+    'stats': {
+        # Inclure les dépôts privés dans les statistiques
+        'include_private': True,
+        
+        # Période d'analyse (jours)
+        'days_back': 365,
+        
+        # Nombre de repos par page (max 100)
+        'max_repos_per_page': 100,
+        
+        # Inclure les statistiques de code (additions/suppressions)
+        'include_code_changes': True,
+        
+        # Inclure les statistiques de langages
+        'include_languages': True,
+        
+        # Inclure la heatmap d'activité
+        'include_heatmap': True,
+        
+        # Inclure les contributions externes
+        'include_external_contributions': False,
+        
+        # Ignorer forks, dépôts archivés, vides ou sans push sur la période
+        # pour les calculs par dépôt (commits, code, heatmap)
+        'skip_inactive': True
+    },
+    
+    'cache': {
+        # Activer le système de cache
+        'enabled': True,
+        
+        # Durée de validité du cache (heures)
+        'max_age_hours': 24,
+        
+        # Répertoire de cache
+        'directory': '.cache',
+        
+        # Nettoyer automatiquement le vieux cache
+        'auto_clean': True
+    },
+    
+    'rate_limit': {
+        # Nombre minimum de requêtes avant d'attendre
+        'min_remaining': 100,
+        
+        # Attendre automatiquement si limite atteinte
+        'wait_on_limit': True,
+        
+        # Durée de validité (secondes) de l'état du rate limit connu
+        # (en-têtes X-RateLimit-* des réponses) avant d'interroger /rate_limit
+        'check_interval': 60,
+        
+        # Requêtes REST maximum sur 60 secondes glissantes (limite
+        # secondaire de GitHub: 900 points/minute, 1 point par GET)
+        'max_per_minute': 900
+    },
+    
+    'readme': {
+        # Fichier template (si vous voulez personnaliser)
+        'template': 'templates/profile_template.md',
+        
+        # Sections à inclure dans le README
+        'sections': [
+            'header',
+            'stats',
+            'repos',
+            'prs',
+            'issues',
+            'languages',
+            'activity',
+            'technologies',
+            'contact'
+        ],
+        
+        # Style des badges
+        'badge_style': 'for-the-badge',
+        
+        # Inclure la date de mise à jour
+        'include_update_time': True
+    },
+    
+    'logging': {
+        # Niveau de log (DEBUG, INFO, WARNING, ERROR)
+        'level': 'INFO',
+        
+        # Répertoire des logs
+        'directory': 'logs',
+        
+        # Taille maximale d'un fichier log (Mo)
+        'max_size_mb': 10,
+        
+        # Nombre de fichiers de backup
+        'backup_count': 5
+    },
+    
+    'output': {
+        # Fichier de sortie du README
+        'readme_file': 'README.md',
+        
+        # Sauvegarder aussi en JSON
+        'save_json': True,
+        
+        # Fichier JSON de sortie
+        'json_file': 'stats/github_stats.json',
+        
+        # Afficher les stats dans la console
+        'print_to_console': True
+    },
+    
+    'advanced': {
+        # Timeout des requêtes HTTP (secondes)
+        'request_timeout': 30,
+        
+        # Nombre de tentatives en cas d'échec
+        'max_retries': 3,
+        
+        # Délai entre les tentatives (secondes)
+        'retry_delay': 2,
+        
+        # Mode parallèle (expérimental)
+        'parallel_requests': False,
+        
+        # Nombre de workers parallèles
+        'parallel_workers': 3
+    }
+}
+
 
 class Config:
     """
@@ -33,11 +236,34 @@ class Config:
     
     Les variables d'environnement surchargent les valeurs du fichier.
     
+    Les clés en notation par points sont indexées au chargement: get()
+    est une simple recherche dans un dictionnaire. L'attribut ns expose la
+    même configuration en accès par attributs (config.ns.cache.enabled).
+    
     Attributes:
         config_file (Path): Chemin vers le fichier de configuration
         data (Dict): Données de configuration chargées
+        ns (SimpleNamespace): Vue par attributs de data (lecture seule)
     """
     
+    # Surcharges d'environnement: (variable, clé de configuration, conversion)
+    ENV_OVERRIDES = (
+        ('GITHUB_TOKEN', 'github.token', str),
+        ('GITHUB_USERNAME', 'github.username', str),
+        ('CACHE_ENABLED', 'cache.enabled', lambda v: v.lower() == 'true'),
+        ('LOG_LEVEL', 'logging.level', str.upper),
+    )
+    
+    # Règles de validation: (clé de configuration, prédicat, message d'erreur)
+    VALIDATORS = (
+        ('github.token', bool, "Token GitHub manquant (GITHUB_TOKEN)"),
+        ('github.username', bool, "Username GitHub manquant (GITHUB_USERNAME)"),
+        ('stats.days_back', lambda v: isinstance(v, int) and v >= 1,
+         "stats.days_back doit être un entier positif"),
+        ('rate_limit.min_remaining', lambda v: isinstance(v, int) and v >= 0,
+         "rate_limit.min_remaining doit être un entier positif"),
+    )
+    
     def __init__(self, config_file: str = 'configs/config.yaml'):
         """
         Initialise la configuration
@@ -47,6 +273,10 @@ class Config:
         """
         self.config_file = Path(config_file)
         self.data = {}
+        self._flat = {}
+        self._ns: Optional[SimpleNamespace] = None
+        self._dirty = False
+        self._display_cache: Optional[str] = None
         self.load()
     
     def load(self):
@@ -55,29 +285,126 @@ class Config:
         
         Si le fichier n'existe pas, crée une configuration par défaut.
         Applique ensuite les surcharges des variables d'environnement.
+        
+        Le fichier n'est reparsé que si sa date de modification ou sa
+        taille a changé depuis le dernier chargement dans le processus.
         """
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    self.data = yaml.safe_load(f) or {}
-                print(f"✅ Configuration chargée depuis {self.config_file}")
+                st = self.config_file.stat()
+                self.data = copy.deepcopy(_parse_config_file(
+                    str(self.config_file.resolve()), st.st_mtime_ns, st.st_size
+                ))
+                logger.info("✅ Configuration chargée depuis %s", self.config_file)
             except yaml.YAMLError as e:
-                print(f"⚠️  Erreur lors du chargement de la config: {e}")
+                logger.warning("⚠️  Erreur lors du chargement de la config: %s", e)
                 self.data = self.get_default_config()
         else:
-            print(f"📝 Création de la configuration par défaut...")
+            # Visible même sans handler configuré (lastResort: WARNING et plus):
+            # un fichier est écrit à la place de l'utilisateur
+            logger.warning("📝 Création de la configuration par défaut dans %s...", self.config_file)
             self.data = self.get_default_config()
             self.save()
         
         # Appliquer les surcharges d'environnement
         self._apply_env_overrides()
+        self._reindex()
+        self._dirty = False
+    
+    def _reindex(self):
+        """
+        Reconstruit l'index {clé.en.points: valeur} utilisé par get()
+        et invalide la vue par attributs ns
+        """
+        self._flat = {}
+        self._flatten(self.data, '', self._flat)
+        self._ns = None
+        self._display_cache = None
     
-    def save(self):
+    @property
+    def ns(self) -> SimpleNamespace:
+        """
+        Vue par attributs de la configuration (config.ns.cache.enabled)
+        
+        Construite au premier accès puis réutilisée jusqu'au prochain
+        load() ou set().
+        
+        Returns:
+            Vue de la configuration courante
+        """
+        if self._ns is None:
+            self._ns = self.snapshot()
+        return self._ns
+    
+    def snapshot(self) -> SimpleNamespace:
+        """
+        Construit une vue par attributs de la configuration
+        
+        Les sections deviennent des SimpleNamespace imbriqués; les autres
+        valeurs (listes, scalaires) sont reprises telles quelles. Contrairement
+        à get(), une clé absente lève AttributeError.
+        
+        Returns:
+            Vue de la configuration au moment de l'appel
+        
+        Example:
+            >>> config = Config()
+            >>> cfg = config.snapshot()
+            >>> cfg.rate_limit.min_remaining
+            100
+        """
+        return self._freeze(self.data)
+    
+    @staticmethod
+    def _freeze(data: Dict[str, Any]) -> SimpleNamespace:
+        """
+        Convertit récursivement un dictionnaire en SimpleNamespace
+        
+        Args:
+            data: Dictionnaire à convertir
+        
+        Returns:
+            Namespace équivalent
+        """
+        return SimpleNamespace(**{
+            str(k): Config._freeze(v) if isinstance(v, dict) else v
+            for k, v in data.items()
+        })
+    
+    @staticmethod
+    def _flatten(data: Dict[str, Any], prefix: str, flat: Dict[str, Any]):
+        """
+        Indexe récursivement un dictionnaire imbriqué par chemins pointés
+        
+        Les sections intermédiaires sont indexées aussi ('stats' comme
+        'stats.days_back').
+        
+        Args:
+            data: Dictionnaire à indexer
+            prefix: Préfixe du chemin courant ('' à la racine)
+            flat: Index à compléter
+        """
+        for k, v in data.items():
+            path = f"{prefix}{k}"
+            flat[path] = v
+            if isinstance(v, dict):
+                Config._flatten(v, f"{path}.", flat)
+    
+    def save(self, force: bool = False):
         """
         Sauvegarde la configuration dans le fichier YAML
         
-        Crée le répertoire parent si nécessaire.
+        Crée le répertoire parent si nécessaire. Ne fait rien si le fichier
+        existe et qu'aucune valeur n'a été modifiée par set() depuis le
+        dernier chargement ou la dernière sauvegarde.
+        
+        Args:
+            force: Écrire même sans modification (ex: après une modification
+                directe de data)
         """
+        if not force and not self._dirty and self.config_file.exists():
+            return
+        
         try:
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
             
@@ -85,158 +412,47 @@ class Config:
                 yaml.dump(
                     self.data,
                     f,
+                    Dumper=_Dumper,
                     default_flow_style=False,
                     allow_unicode=True,
                     sort_keys=False
                 )
             
-            print(f"✅ Configuration sauvegardée dans {self.config_file}")
+            self._dirty = False
+            logger.info("✅ Configuration sauvegardée dans %s", self.config_file)
         
         except Exception as e:
-            print(f"❌ Erreur lors de la sauvegarde de la config: {e}")
+            logger.error("❌ Erreur lors de la sauvegarde de la config: %s", e)
     
     def get_default_config(self) -> Dict[str, Any]:
         """
         Retourne la configuration par défaut
         
+        Copie de _DEFAULT_CONFIG, avec le token et le username lus dans
+        l'environnement.
+        
         Returns:
             Dictionnaire avec toutes les options par défaut
         """
-        return {
-            'github': {
-                'token': os.getenv('GITHUB_TOKEN', ''),
-                'username': os.getenv('GITHUB_USERNAME', ''),
-                'api_url': 'https://api.github.com'
-            },
-            
-            'stats': {
-                # Inclure les dépôts privés dans les statistiques
-                'include_private': True,
-                
-                # Période d'analyse (jours)
-                'days_back': 365,
-                
-                # Nombre de repos par page (max 100)
-                'max_repos_per_page': 100,
-                
-                # Nombre maximum de pages de commits à analyser par repo
-                'max_commits_pages': 10,
-                
-                # Inclure les statistiques de code (additions/suppressions)
-                'include_code_changes': True,
-                
-                # Inclure les statistiques de langages
-                'include_languages': True,
-                
-                # Inclure la heatmap d'activité
-                'include_heatmap': True,
-                
-                # Inclure les contributions externes
-                'include_external_contributions': False
-            },
-            
-            'cache': {
-                # Activer le système de cache
-                'enabled': True,
-                
-                # Durée de validité du cache (heures)
-                'max_age_hours': 24,
-                
-                # Répertoire de cache
-                'directory': '.cache',
-                
-                # Nettoyer automatiquement le vieux cache
-                'auto_clean': True
-            },
-            
-            'rate_limit': {
-                # Nombre minimum de requêtes avant d'attendre
-                'min_remaining': 100,
-                
-                # Attendre automatiquement si limite atteinte
-                'wait_on_limit': True,
-                
-                # Vérifier le rate limit toutes les N secondes
-                'check_interval': 5
-            },
-            
-            'readme': {
-                # Fichier template (si vous voulez personnaliser)
-                'template': 'templates/profile_template.md',
-                
-                # Sections à inclure dans le README
-                'sections': [
-                    'header',
-                    'stats',
-                    'repos',
-                    'prs',
-                    'issues',
-                    'languages',
-                    'activity',
-                    'technologies',
-                    'contact'
-                ],
-                
-                # Style des badges
-                'badge_style': 'for-the-badge',
-                
-                # Inclure la date de mise à jour
-                'include_update_time': True
-            },
-            
-            'logging': {
-                # Niveau de log (DEBUG, INFO, WARNING, ERROR)
-                'level': 'INFO',
-                
-                # Répertoire des logs
-                'directory': 'logs',
-                
-                # Taille maximale d'un fichier log (Mo)
-                'max_size_mb': 10,
-                
-                # Nombre de fichiers de backup
-                'backup_count': 5
-            },
-            
-            'output': {
-                # Fichier de sortie du README
-                'readme_file': 'README.md',
-                
-                # Sauvegarder aussi en JSON
-                'save_json': True,
-                
-                # Fichier JSON de sortie
-                'json_file': 'stats/github_stats.json',
-                
-                # Afficher les stats dans la console
-                'print_to_console': True
-            }
-        }
+        config = copy.deepcopy(_DEFAULT_CONFIG)
+        config['github']['token'] = os.getenv('GITHUB_TOKEN', '')
+        config['github']['username'] = os.getenv('GITHUB_USERNAME', '')
+        return config
     
     def _apply_env_overrides(self):
         """
         Applique les surcharges depuis les variables d'environnement
         
-        Variables supportées:
+        Variables supportées (voir ENV_OVERRIDES):
         - GITHUB_TOKEN: Token d'authentification
         - GITHUB_USERNAME: Nom d'utilisateur GitHub
         - CACHE_ENABLED: Activer/désactiver le cache
         - LOG_LEVEL: Niveau de logging
         """
-        # GitHub
-        if os.getenv('GITHUB_TOKEN'):
-            self.data['github']['token'] = os.getenv('GITHUB_TOKEN')
-        
-        if os.getenv('GITHUB_USERNAME'):
-            self.data['github']['username'] = os.getenv('GITHUB_USERNAME')
-        
-        # Cache
-        if os.getenv('CACHE_ENABLED'):
-            self.data['cache']['enabled'] = os.getenv('CACHE_ENABLED').lower() == 'true'
-        
-        # Logging
-        if os.getenv('LOG_LEVEL'):
-            self.data['logging']['level'] = os.getenv('LOG_LEVEL').upper()
+        for env_name, key, cast in self.ENV_OVERRIDES:
+            value = os.environ.get(env_name)
+            if value:
+                self._set_path(key, cast(value))
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -256,16 +472,7 @@ class Config:
             >>> token = config.get('github.token')
             >>> cache_enabled = config.get('cache.enabled', True)
         """
-        keys = key.split('.')
-        value = self.data
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        return self._flat.get(key, default)
     
     def set(self, key: str, value: Any):
         """
@@ -280,6 +487,18 @@ class Config:
             >>> config.set('github.token', 'ghp_xxx')
             >>> config.save()
         """
+        self._set_path(key, value)
+        self._reindex()
+        self._dirty = True
+    
+    def _set_path(self, key: str, value: Any):
+        """
+        Écrit une valeur dans self.data sans reconstruire l'index
+        
+        Args:
+            key: Clé de configuration (notation par points supportée)
+            value: Valeur à définir
+        """
         keys = key.split('.')
         data = self.data
         
@@ -296,7 +515,7 @@ class Config:
         """
         Valide la configuration
         
-        Vérifie que les paramètres obligatoires sont présents.
+        Vérifie que les paramètres obligatoires sont présents (voir VALIDATORS).
         
         Returns:
             Tuple (is_valid, errors)
@@ -310,46 +529,36 @@ class Config:
             ...     for error in errors:
             ...         print(f"Erreur: {error}")
         """
-        errors = []
-        
-        # Vérifier le token GitHub
-        token = self.get('github.token')
-        if not token:
-            errors.append("Token GitHub manquant (GITHUB_TOKEN)")
-        
-        # Vérifier le username
-        username = self.get('github.username')
-        if not username:
-            errors.append("Username GitHub manquant (GITHUB_USERNAME)")
-        
-        # Vérifier les valeurs numériques
-        days_back = self.get('stats.days_back')
-        if not isinstance(days_back, int) or days_back < 1:
-            errors.append("stats.days_back doit être un entier positif")
-        
-        min_remaining = self.get('rate_limit.min_remaining')
-        if not isinstance(min_remaining, int) or min_remaining < 0:
-            errors.append("rate_limit.min_remaining doit être un entier positif")
+        errors = [
+            message
+            for key, is_valid, message in self.VALIDATORS
+            if not is_valid(self.get(key))
+        ]
         
         return len(errors) == 0, errors
     
     def display(self):
         """
         Affiche la configuration actuelle (masque le token)
+        
+        Le rendu YAML est conservé jusqu'au prochain load() ou set().
         """
+        if self._display_cache is None:
+            # Copier la section github pour masquer le token sans modifier data
+            display_data = dict(self.data)
+            github = display_data.get('github')
+            if isinstance(github, dict) and github.get('token'):
+                token = github['token']
+                display_data['github'] = dict(github, token=token[:8] + '...' + token[-4:] if len(token) > 12 else '***')
+            
+            self._display_cache = yaml.dump(display_data, Dumper=_Dumper, default_flow_style=False, allow_unicode=True)
+        
         print("\n" + "=" * 60)
         print("📋 CONFIGURATION ACTUELLE")
         print("=" * 60)
         
-        # Copier et masquer le token
-        display_data = dict(self.data)
-        if 'github' in display_data and 'token' in display_data['github']:
-            token = display_data['github']['token']
-            if token:
-                display_data['github']['token'] = token[:8] + '...' + token[-4:] if len(token) > 12 else '***'
-        
         # Afficher en YAML
-        print(yaml.dump(display_data, default_flow_style=False, allow_unicode=True))
+        print(self._display_cache)
         print("=" * 60 + "\n")
     
     def to_dict(self) -> Dict[str, Any]:
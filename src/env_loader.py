@@ -17,16 +17,32 @@ Fonctionnalités:
 """
 
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
 
 
-def load_env_file(env_file: str = '.env') -> Dict[str, str]:
+# Variables lues par l'application (voir Config.ENV_OVERRIDES)
+APP_ENV_VARS = frozenset({'GITHUB_TOKEN', 'GITHUB_USERNAME', 'CACHE_ENABLED', 'LOG_LEVEL'})
+
+# Ligne CLE=valeur, valeur éventuellement entre guillemets simples ou doubles
+_ENV_RE = re.compile(r'''^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(?:"([^"]*)"|'([^']*)'|(.*?))\s*$''')
+
+# Résultats de find_dotenv par (nom, répertoire de départ); None si absent
+_found_dotenv: Dict[Tuple[str, str], Optional[Path]] = {}
+
+
+def load_env_file(env_file: str = '.env', only: Optional[Iterable[str]] = None) -> Dict[str, str]:
     """
     Charge les variables depuis un fichier .env
     
+    Avec only, seules les variables demandées sont retenues. Dans les deux
+    cas, la dernière occurrence d'une clé l'emporte.
+    
     Args:
         env_file: Chemin vers le fichier .env
+        only: Noms des variables à charger (défaut: toutes)
     
     Returns:
         Dictionnaire des variables chargées
@@ -36,37 +52,50 @@ def load_env_file(env_file: str = '.env') -> Dict[str, str]:
         >>> print(variables['GITHUB_TOKEN'])
     """
     env_path = Path(env_file)
-    variables = {}
     
-    if not env_path.exists():
-        return variables
+    try:
+        mtime_ns = env_path.stat().st_mtime_ns
+    except OSError:
+        return {}
+    
+    # Le contenu n'est relu que si le fichier a été modifié
+    wanted = frozenset(only) if only is not None else None
+    return dict(_parse_env_file(str(env_path.resolve()), mtime_ns, wanted))
+
+
+@lru_cache(maxsize=8)
+def _parse_env_file(env_file: str, mtime_ns: int, only: Optional[FrozenSet[str]] = None) -> Dict[str, str]:
+    """
+    Lit et parse un fichier .env (résultat mis en cache)
+    
+    Args:
+        env_file: Chemin absolu du fichier .env
+        mtime_ns: Date de modification, clé d'invalidation du cache
+        only: Variables à charger (les autres lignes sont ignorées)
+    
+    Returns:
+        Dictionnaire des variables (ne pas modifier)
+    """
+    variables = {}
     
     try:
-        with open(env_path, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                # Supprimer les espaces
-                line = line.strip()
-                
+        with open(env_file, 'r', encoding='utf-8') as f:
+            for line in f:
                 # Ignorer les lignes vides et les commentaires
-                if not line or line.startswith('#'):
+                stripped = line.lstrip()
+                if not stripped or stripped[0] == '#':
                     continue
                 
-                # Chercher le séparateur '='
-                if '=' not in line:
+                match = _ENV_RE.match(line)
+                if not match:
                     continue
                 
-                # Séparer clé et valeur
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                # Supprimer les guillemets si présents
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
+                key = match.group(1)
+                value = match.group(2) or match.group(3) or match.group(4) or ''
                 
-                variables[key] = value
+                # Comme sans filtre, la dernière occurrence d'une clé l'emporte
+                if only is None or key in only:
+                    variables[key] = value
         
         return variables
     
@@ -75,7 +104,8 @@ def load_env_file(env_file: str = '.env') -> Dict[str, str]:
         return {}
 
 
-def load_dotenv(env_file: str = '.env', override: bool = True) -> bool:
+def load_dotenv(env_file: str = '.env', override: bool = True,
+                only: Optional[Iterable[str]] = None) -> bool:
     """
     Charge le fichier .env dans os.environ
     
@@ -84,6 +114,7 @@ def load_dotenv(env_file: str = '.env', override: bool = True) -> bool:
     Args:
         env_file: Chemin vers le fichier .env
         override: Si True, écrase les variables existantes
+        only: Noms des variables à charger (défaut: toutes)
     
     Returns:
         True si le fichier a été chargé, False sinon
@@ -92,17 +123,16 @@ def load_dotenv(env_file: str = '.env', override: bool = True) -> bool:
         >>> load_dotenv()
         >>> token = os.getenv('GITHUB_TOKEN')
     """
-    variables = load_env_file(env_file)
+    variables = load_env_file(env_file, only)
     
     if not variables:
         return False
     
-    for key, value in variables.items():
-        # Ne pas écraser si override est False et la variable existe déjà
-        if not override and key in os.environ:
-            continue
-        
-        os.environ[key] = value
+    # Ne pas écraser si override est False et la variable existe déjà
+    if not override:
+        variables = {k: v for k, v in variables.items() if k not in os.environ}
+    
+    os.environ.update(variables)
     
     return True
 
@@ -172,11 +202,20 @@ def find_dotenv(filename: str = '.env', start_dir: Optional[Path] = None) -> Opt
     
     current = Path(start_dir).resolve()
     
+    # Réutiliser un résultat précédent: absence mémorisée, ou fichier
+    # trouvé qui existe toujours
+    key = (filename, str(current))
+    if key in _found_dotenv:
+        found = _found_dotenv[key]
+        if found is None or found.exists():
+            return found
+    
     # Remonter jusqu'à la racine
     while True:
         env_file = current / filename
         
         if env_file.exists():
+            _found_dotenv[key] = env_file
             return env_file
         
         # Si on est à la racine, arrêter
@@ -186,6 +225,7 @@ def find_dotenv(filename: str = '.env', start_dir: Optional[Path] = None) -> Opt
         
         current = parent
     
+    _found_dotenv[key] = None
     return None
 
 
@@ -256,6 +296,9 @@ GITHUB_USERNAME=
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(template)
         
+        # Un fichier .env a pu apparaître là où find_dotenv n'en trouvait pas
+        _found_dotenv.clear()
+        
         print(f"✅ Fichier {output_file} créé avec succès")
         print(f"   Éditez-le pour ajouter vos credentials")
         return True
@@ -270,17 +313,26 @@ def auto_load():
     """
     Charge automatiquement le .env s'il existe
     
-    Appelé automatiquement lors de l'import du module.
+    Appelé automatiquement lors de l'import du module. Seules les variables
+    lues par l'application (APP_ENV_VARS) sont chargées; les scripts
+    appellent load_dotenv() pour charger le fichier complet.
+    
+    Rien n'est lu si GITHUB_TOKEN et GITHUB_USERNAME sont déjà définis
+    (CI, conteneurs). DISABLE_DOTENV_AUTOLOAD=1 désactive l'appel à l'import.
     """
+    if os.environ.get('GITHUB_TOKEN') and os.environ.get('GITHUB_USERNAME'):
+        return
+    
     env_path = find_dotenv()
     
     if env_path:
-        success = load_dotenv(str(env_path), override=False)
+        success = load_dotenv(str(env_path), override=False, only=APP_ENV_VARS)
         if success:
             # Mode silencieux - ne pas afficher de message
             pass
     
 
-# Charger automatiquement lors de l'import
-auto_load()
+# Charger automatiquement lors de l'import (sauf si désactivé)
+if os.environ.get('DISABLE_DOTENV_AUTOLOAD', '').lower() not in ('1', 'true', 'yes'):
+    auto_load()
 
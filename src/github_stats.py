@@ -14,30 +14,85 @@ Ce module utilise l'API GitHub pour collecter:
 - Contributions externes
 
 Le module intègre:
+- API GraphQL pour récupérer dépôts, étoiles et langages en un seul appel
 - Système de cache pour optimiser les requêtes
 - Gestion du rate limiting
+- Requêtes par dépôt en parallèle (pool de threads)
 - Logging détaillé
 - Retry automatique en cas d'erreur
 """
 
 import os
+import time
+import asyncio
 import requests
 import base64
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+import threading
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Any, Tuple, Callable
+from urllib.parse import urlencode, urlparse, parse_qs
 from pathlib import Path
 
 from .cache_manager import CacheManager
-from .rate_limiter import RateLimitHandler, rate_limit_aware, with_retry
+from .rate_limiter import (
+    RateLimitHandler, ConcurrencyController, rate_limit_aware, with_retry,
+    is_rate_limited, retry_delay
+)
 from .config import Config
+from .http_client import create_session
 from .utils import (
     format_number, generate_ascii_bar, generate_language_bar,
     generate_heatmap_ascii, create_badge_url, format_relative_time,
-    get_emoji_for_metric, safe_divide
+    get_emoji_for_metric, safe_divide, json_loads
 )
 
 
+# Nombre maximum de nouvelles tentatives quand /stats/contributors répond 202
+STATS_MAX_POLLS = 5
+
+
+# Requête GraphQL paginée: dépôts, étoiles et langages en un seul appel
+REPOS_QUERY = """
+query($first: Int!, $cursor: String) {
+  viewer {
+    repositories(first: $first, after: $cursor, ownerAffiliations: OWNER) {
+      pageInfo {
+        endCursor
+        hasNextPage
+      }
+      nodes {
+        name
+        nameWithOwner
+        isPrivate
+        isFork
+        isArchived
+        diskUsage
+        stargazerCount
+        createdAt
+        updatedAt
+        pushedAt
+        primaryLanguage {
+          name
+        }
+        languages(first: 20, orderBy: {field: SIZE, direction: DESC}) {
+          totalCount
+          edges {
+            size
+            node {
+              name
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
 class GitHubStatsPrivate:
     """
     Classe principale pour récupérer les statistiques GitHub
@@ -70,17 +125,39 @@ class GitHubStatsPrivate:
             'Accept': 'application/vnd.github.v3+json'
         }
         self.base_url = 'https://api.github.com'
+        self.graphql_url = f'{self.base_url}/graphql'
         
         # Configuration
         self.config = config or Config()
         
+        # Session HTTP partagée (keep-alive: une seule poignée de main TLS),
+        # pool dimensionné pour les requêtes parallèles (plusieurs calculs
+        # de statistiques, chacun répartissant ses requêtes par dépôt).
+        # Les en-têtes d'authentification sont portés par la session.
+        pool_size = 2 * max(self.config.get('advanced.parallel_workers', 3), 10)
+        self.session = create_session(pool_size, self.headers)
+        
         # Cache
         cache_dir = self.config.get('cache.directory', '.cache')
         self.cache = CacheManager(cache_dir)
         
         # Rate limiter
         min_remaining = self.config.get('rate_limit.min_remaining', 100)
-        self.rate_limiter = RateLimitHandler(self.headers, min_remaining)
+        self.rate_limiter = RateLimitHandler(
+            self.headers, min_remaining, session=self.session,
+            check_interval=self.config.get('rate_limit.check_interval', 60),
+            max_per_minute=self.config.get('rate_limit.max_per_minute', 900)
+        )
+        
+        # Requêtes GET en cours, partagées entre appelants identiques
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Requêtes simultanées: limite adaptative (AIMD) bornée par le pool
+        self.concurrency = ConcurrencyController(
+            initial=self.config.get('advanced.parallel_workers', 3),
+            maximum=pool_size
+        )
         
         # Logger
         self.logger = self._setup_logger()
@@ -130,14 +207,337 @@ class GitHubStatsPrivate:
         
         return logger
     
-    @rate_limit_aware
+    def _request(self, method: str, url: str, max_retries: int = 3, **kwargs) -> requests.Response:
+        """
+        Envoie une requête sur la session partagée
+        
+        Met à jour le rate limiter depuis les en-têtes de la réponse. Le
+        nombre de requêtes simultanées est régulé par self.concurrency. Si
+        GitHub refuse la requête pour cause de rate limit (429, ou 403 avec
+        Retry-After / quota épuisé), attend le délai indiqué puis réessaie.
+        
+        Args:
+            method: Méthode HTTP
+            url: URL de l'endpoint
+            max_retries: Nombre maximum de nouvelles tentatives
+            **kwargs: Arguments passés à session.request
+        
+        Returns:
+            Dernière réponse reçue
+        """
+        kwargs.setdefault('timeout', 30)
+        
+        for attempt in range(max_retries + 1):
+            with self.concurrency:
+                start = time.monotonic()
+                response = self.session.request(method, url, **kwargs)
+            self.concurrency.record(time.monotonic() - start, response)
+            self.rate_limiter.update_from_headers(response.headers)
+            
+            if attempt == max_retries or not is_rate_limited(response):
+                return response
+            
+            wait_seconds = retry_delay(response.headers, 2 ** (attempt + 1))
+            self.logger.warning(f"⏳ Rate limit ({response.status_code}), nouvelle tentative dans {int(wait_seconds)}s")
+            time.sleep(wait_seconds)
+        
+        return response
+    
+    def _graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Exécute une requête GraphQL sur l'API GitHub v4
+        
+        Args:
+            query: Requête GraphQL
+            variables: Variables de la requête
+        
+        Returns:
+            Contenu du champ 'data' de la réponse
+        
+        Raises:
+            requests.HTTPError: En cas d'erreur HTTP
+            RuntimeError: Si l'API retourne des erreurs GraphQL
+        """
+        response = self._request(
+            'POST',
+            self.graphql_url,
+            json={'query': query, 'variables': variables or {}}
+        )
+        response.raise_for_status()
+        
+        payload = json_loads(response.content)
+        if payload.get('errors'):
+            messages = ', '.join(error.get('message', '?') for error in payload['errors'])
+            raise RuntimeError(f"Erreur GraphQL: {messages}")
+        
+        return payload['data']
+    
+    def _get_json(self, url: str, params: Optional[Dict[str, Any]] = None,
+                  version: Optional[str] = None,
+                  parse: Optional[Callable[[requests.Response], Any]] = None) -> Tuple[int, Any]:
+        """
+        Effectue un GET conditionnel (ETag / If-None-Match)
+        
+        Si une réponse précédente est en cache, son ETag est envoyé:
+        une réponse 304 ne transfère aucun corps et ne consomme pas le
+        rate limit principal, les données en cache sont alors retournées.
+        
+        Avec version (pushed_at du dépôt pour les données par dépôt), la
+        réponse est enregistrée avec cette version et réutilisée sans appel
+        réseau tant qu'elle ne change pas, quel que soit son âge.
+        
+        Args:
+            url: URL de l'endpoint
+            params: Paramètres de la requête
+            version: Valeur dont dépend la réponse; le cache n'est
+                revalidé que si elle a changé
+            parse: Extraction des données depuis la réponse 200 (défaut:
+                corps JSON); c'est son résultat qui est mis en cache
+        
+        Returns:
+            Tuple (status_code, données). Les données valent None si le
+            statut n'est pas 200.
+        """
+        use_cache = self.config.get('cache.enabled', True)
+        cache_key = f"GET {url}?{urlencode(sorted((params or {}).items()))}"
+        if version is not None:
+            # Entrées {version, data}: clé distincte des entrées simples
+            cache_key = f"V{cache_key}"
+        if parse is not None:
+            # Données extraites: clé distincte du corps JSON complet
+            cache_key = f"{cache_key} |{parse.__name__}"
+        
+        # Appels simultanés identiques (threads des calculs parallèles):
+        # une seule requête, résultat partagé
+        return self._single_flight(
+            cache_key,
+            lambda: self._fetch_json(cache_key, url, params, version, parse, use_cache)
+        )
+    
+    def _single_flight(self, key: str, func: Callable[[], Any]) -> Any:
+        """
+        Exécute func une seule fois pour des appels simultanés de même clé
+        
+        Le premier appelant exécute func; ceux qui arrivent avant la fin
+        attendent et reçoivent le même résultat (ou la même exception).
+        Rien n'est conservé après coup: le cache prend le relais.
+        
+        Args:
+            key: Clé identifiant l'appel
+            func: Fonction à exécuter
+        
+        Returns:
+            Résultat de func
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        
+        if not owner:
+            return future.result()
+        
+        try:
+            result = func()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+    
+    def _fetch_json(self, cache_key: str, url: str, params: Optional[Dict[str, Any]],
+                    version: Optional[str],
+                    parse: Optional[Callable[[requests.Response], Any]],
+                    use_cache: bool) -> Tuple[int, Any]:
+        """
+        Corps de _get_json pour une clé de cache donnée
+        
+        Returns:
+            Tuple (status_code, données), voir _get_json
+        """
+        cached, etag = self.cache.get_with_etag(cache_key) if use_cache else (None, None)
+        
+        if version is not None and etag:
+            if cached['version'] == version:
+                return 200, cached['data']
+            cached = cached['data']
+        
+        headers = {'If-None-Match': etag} if etag else None
+        
+        # Contrôle du rate limit, seulement pour les requêtes qui partent
+        # réellement (les réponses en cache sont retournées plus haut):
+        # étale les requêtes quand le quota restant devient faible
+        self.rate_limiter.acquire()
+        response = self._request('GET', url, headers=headers, params=params)
+        
+        if response.status_code == 304:
+            # Données inchangées: l'entrée est marquée comme revalidée
+            if version is None:
+                self.cache.touch(cache_key)
+            else:
+                self.cache.set_with_etag(cache_key, {'version': version, 'data': cached}, etag)
+            return 200, cached
+        
+        if response.status_code != 200:
+            return response.status_code, None
+        
+        data = parse(response) if parse else json_loads(response.content)
+        
+        if use_cache and response.headers.get('ETag'):
+            entry = data if version is None else {'version': version, 'data': data}
+            self.cache.set_with_etag(cache_key, entry, response.headers['ETag'])
+        
+        return 200, data
+    
+    def _since_date(self) -> datetime:
+        """
+        Date de début de la période d'analyse
+        
+        Arrondie à minuit pour que les URLs (paramètre 'since') restent
+        identiques d'une exécution à l'autre dans la journée, ce qui
+        permet les requêtes conditionnelles.
+        
+        Returns:
+            Date de début de la période
+        """
+        days_back = self.config.get('stats.days_back', 365)
+        since_date = datetime.now() - timedelta(days=days_back)
+        return since_date.replace(hour=0, minute=0, second=0, microsecond=0)
+    
+    def _active_repos(self, repos: List[Dict]) -> List[Dict]:
+        """
+        Dépôts susceptibles d'avoir des commits sur la période
+        
+        Avec stats.skip_inactive, les forks, dépôts archivés, dépôts vides
+        et dépôts sans push depuis le début de la période sont écartés des
+        calculs qui font un appel réseau par dépôt. Un dépôt est considéré
+        vide s'il n'a reçu aucun push depuis sa création (la taille n'est
+        pas fiable: calculée en différé, elle peut valoir 0 ou être absente
+        juste après un push).
+        
+        Args:
+            repos: Liste des dépôts
+        
+        Returns:
+            Dépôts à interroger
+        """
+        if not self.config.get('stats.skip_inactive', True):
+            return repos
+        
+        since = self._since_date().strftime('%Y-%m-%dT%H:%M:%SZ')
+        
+        return [
+            repo for repo in repos
+            if not repo.get('fork')
+            and not repo.get('archived')
+            and (repo.get('pushed_at') or '') >= since
+            and not self._never_pushed(repo)
+        ]
+    
+    @staticmethod
+    def _never_pushed(repo: Dict) -> bool:
+        """
+        Indique si un dépôt n'a reçu aucun push depuis sa création
+        
+        Args:
+            repo: Dépôt (champs created_at et pushed_at, ISO 8601)
+        
+        Returns:
+            True si pushed_at n'est pas postérieur à created_at; False si
+            l'une des dates est inconnue (dépôt conservé)
+        """
+        created_at = repo.get('created_at')
+        pushed_at = repo.get('pushed_at')
+        return bool(created_at and pushed_at) and pushed_at <= created_at
+    
+    def _map_repos(self, func: Callable[[Dict], Any], repos: List[Dict]) -> List[Any]:
+        """
+        Applique une fonction à chaque dépôt, en parallèle si activé
+        
+        Les appels réseau par dépôt sont indépendants: un pool de threads
+        (advanced.parallel_workers) superpose leurs temps d'attente.
+        Quand le quota restant est faible par rapport au nombre de dépôts,
+        le nombre de workers est réduit d'autant. L'ordre des résultats
+        suit celui des dépôts.
+        
+        Args:
+            func: Fonction appelée avec un dépôt
+            repos: Liste des dépôts
+        
+        Returns:
+            Liste des résultats de func
+        """
+        workers = 1
+        if self.config.get('advanced.parallel_requests', False):
+            workers = self.config.get('advanced.parallel_workers', 3)
+        
+        # Quota au-dessus de la réserve (dernière valeur connue, sans requête)
+        rate_info = self.rate_limiter.get_cached_rate_info()
+        if rate_info and repos:
+            headroom = rate_info['remaining'] - self.rate_limiter.min_remaining
+            workers = min(workers, max(1, headroom // len(repos)))
+        
+        if workers <= 1 or len(repos) <= 1:
+            return [func(repo) for repo in repos]
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, repos))
+    
+    @staticmethod
+    def _normalize_repo(node: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convertit un nœud GraphQL en dictionnaire au format REST
+        
+        Conserve les clés utilisées par le reste du module (full_name,
+        private, stargazers_count, updated_at...) et y ajoute les
+        langages déjà récupérés ({langage: octets}) s'ils sont complets.
+        
+        Args:
+            node: Nœud 'repository' retourné par GraphQL
+        
+        Returns:
+            Dictionnaire représentant le dépôt
+        """
+        primary_language = node.get('primaryLanguage') or {}
+        
+        repo = {
+            'name': node['name'],
+            'full_name': node['nameWithOwner'],
+            'private': node['isPrivate'],
+            'stargazers_count': node['stargazerCount'],
+            'created_at': node['createdAt'],
+            'updated_at': node['updatedAt'],
+            'pushed_at': node['pushedAt'],
+            'fork': node['isFork'],
+            'archived': node['isArchived'],
+            # None si inconnu (calculé en différé par GitHub)
+            'size': node['diskUsage'],
+            'language': primary_language.get('name')
+        }
+        
+        # Liste tronquée (plus de 20 langages): laisser _fetch_repo_languages
+        # récupérer la liste complète via l'API REST
+        languages = node['languages']
+        if languages.get('totalCount', 0) <= len(languages['edges']):
+            repo['languages'] = {
+                edge['node']['name']: edge['size']
+                for edge in languages['edges']
+            }
+        
+        return repo
+    
     @with_retry(max_retries=3, delay=2)
     def get_all_repos(self) -> List[Dict]:
         """
         Récupère TOUS les dépôts (publics + privés)
         
         Utilise le cache si activé et valide.
-        Pagine automatiquement pour récupérer tous les repos.
+        Une seule requête GraphQL par page de 100 dépôts récupère aussi
+        les étoiles et les langages, ce qui évite un appel REST par dépôt.
         
         Returns:
             Liste de dictionnaires représentant les dépôts
@@ -158,28 +558,28 @@ class GitHubStatsPrivate:
         
         self.logger.info("🔍 Récupération des dépôts depuis l'API...")
         
+        # Contrôle du rate limit seulement quand la requête quitte le
+        # processus: une réponse en cache ne l'attend jamais
+        self.rate_limiter.wait_if_needed()
+        
         repos = []
         page = 1
-        per_page = self.config.get('stats.max_repos_per_page', 100)
+        cursor = None
+        per_page = min(self.config.get('stats.max_repos_per_page', 100), 100)
         
         while True:
-            url = f'{self.base_url}/user/repos'
-            params = {
-                'per_page': per_page,
-                'page': page,
-                'type': 'owner',  # Seulement vos dépôts
-                'sort': 'updated'
-            }
+            data = self._graphql(REPOS_QUERY, {'first': per_page, 'cursor': cursor})
+            repositories = data['viewer']['repositories']
             
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
-            response.raise_for_status()
+            nodes = repositories['nodes']
+            repos.extend(self._normalize_repo(node) for node in nodes)
+            self.logger.debug(f"   Page {page}: {len(nodes)} repos récupérés")
             
-            data = response.json()
-            if not data:
+            page_info = repositories['pageInfo']
+            if not page_info['hasNextPage']:
                 break
             
-            repos.extend(data)
-            self.logger.debug(f"   Page {page}: {len(data)} repos récupérés")
+            cursor = page_info['endCursor']
             page += 1
         
         self.logger.info(f"✅ {len(repos)} dépôt(s) récupéré(s)")
@@ -204,7 +604,6 @@ class GitHubStatsPrivate:
         self.logger.info(f"⭐ Total d'étoiles: {total}")
         return total
     
-    @rate_limit_aware
     def count_commits_last_year(self, repos: List[Dict]) -> int:
         """
         Compte les commits de la dernière année
@@ -220,154 +619,146 @@ class GitHubStatsPrivate:
         """
         self.logger.info("📝 Comptage des commits...")
         
-        total_commits = 0
-        days_back = self.config.get('stats.days_back', 365)
-        since_date = datetime.now() - timedelta(days=days_back)
-        max_pages = self.config.get('stats.max_commits_pages', 10)
-        
-        for i, repo in enumerate(repos, 1):
-            repo_name = repo['full_name']
-            self.logger.debug(f"   [{i}/{len(repos)}] {repo_name}")
-            
-            try:
-                url = f'{self.base_url}/repos/{repo_name}/commits'
-                params = {
-                    'author': self.username,
-                    'since': since_date.isoformat(),
-                    'per_page': 100
-                }
-                
-                page = 1
-                while page <= max_pages:
-                    params['page'] = page
-                    response = requests.get(url, headers=self.headers, params=params, timeout=30)
-                    
-                    if response.status_code != 200:
-                        break
-                    
-                    commits = response.json()
-                    if not commits:
-                        break
-                    
-                    total_commits += len(commits)
-                    page += 1
-                
-            except Exception as e:
-                self.logger.warning(f"⚠️  Erreur commits pour {repo_name}: {e}")
-                continue
+        total_commits = sum(self._map_repos(self._count_repo_commits, repos))
         
         self.logger.info(f"✅ Total commits: {total_commits}")
         return total_commits
     
-    @rate_limit_aware
+    def _count_repo_commits(self, repo: Dict) -> int:
+        """
+        Compte les commits récents de l'utilisateur dans un dépôt
+        
+        Une page d'un seul commit est demandée: le numéro de la dernière
+        page (en-tête Link, rel="last") est le nombre de commits, sans
+        télécharger la liste.
+        
+        Args:
+            repo: Dépôt à analyser
+        
+        Returns:
+            Nombre de commits (0 en cas d'erreur)
+        """
+        repo_name = repo['full_name']
+        self.logger.debug(f"   {repo_name}")
+        
+        try:
+            url = f'{self.base_url}/repos/{repo_name}/commits'
+            params = {
+                'author': self.username,
+                'since': self._since_date().isoformat(),
+                'per_page': 1
+            }
+            
+            status, count = self._get_json(
+                url, params,
+                version=repo.get('pushed_at'),
+                parse=self._count_from_links
+            )
+            return count if status == 200 else 0
+        
+        except Exception as e:
+            self.logger.warning(f"⚠️  Erreur commits pour {repo_name}: {e}")
+            return 0
+    
+    @staticmethod
+    def _count_from_links(response: requests.Response) -> int:
+        """
+        Nombre d'éléments d'une liste paginée avec per_page=1
+        
+        Args:
+            response: Réponse de la première page
+        
+        Returns:
+            Numéro de la dernière page, ou taille de la page s'il n'y en a qu'une
+        """
+        last = response.links.get('last', {}).get('url')
+        if last:
+            return int(parse_qs(urlparse(last).query)['page'][0])
+        
+        return len(json_loads(response.content))
+    
+    def _search_count(self, query: str) -> int:
+        """
+        Compte les résultats d'une recherche d'issues/PRs
+        
+        Utilise /search/issues avec per_page=1: seul le champ total_count
+        est exploité. Ces appels consomment le quota 'search' (30/min)
+        et non le quota principal.
+        
+        Args:
+            query: Requête de recherche GitHub (ex: 'author:user type:pr')
+        
+        Returns:
+            Nombre total de résultats (0 en cas d'erreur)
+        """
+        self.rate_limiter.wait_if_needed(resource='search')
+        
+        try:
+            url = f'{self.base_url}/search/issues'
+            params = {'q': query, 'per_page': 1}
+            response = self._request('GET', url, params=params)
+            
+            if response.status_code == 200:
+                return json_loads(response.content).get('total_count', 0)
+            
+            self.logger.warning(f"⚠️  Recherche '{query}' échouée: {response.status_code}")
+        
+        except Exception as e:
+            self.logger.warning(f"⚠️  Erreur recherche '{query}': {e}")
+        
+        return 0
+    
     def count_pull_requests(self, repos: List[Dict]) -> Dict[str, int]:
         """
         Compte les Pull Requests (créées par l'utilisateur)
         
+        Trois requêtes de recherche remplacent le parcours des dépôts,
+        quel que soit leur nombre.
+        
         Args:
-            repos: Liste des dépôts
+            repos: Liste des dépôts (conservé pour compatibilité)
         
         Returns:
             Dictionnaire avec les stats de PRs
         """
         self.logger.info("🔀 Comptage des Pull Requests...")
         
+        query = f'author:{self.username} type:pr'
+        
         stats = {
-            'total': 0,
-            'open': 0,
+            'total': self._search_count(query),
+            'open': self._search_count(f'{query} state:open'),
             'closed': 0,
-            'merged': 0
+            'merged': self._search_count(f'{query} is:merged')
         }
-        
-        for i, repo in enumerate(repos, 1):
-            repo_name = repo['full_name']
-            self.logger.debug(f"   [{i}/{len(repos)}] {repo_name}")
-            
-            try:
-                url = f'{self.base_url}/repos/{repo_name}/pulls'
-                params = {
-                    'state': 'all',
-                    'creator': self.username,
-                    'per_page': 100
-                }
-                
-                response = requests.get(url, headers=self.headers, params=params, timeout=30)
-                
-                if response.status_code != 200:
-                    continue
-                
-                prs = response.json()
-                
-                for pr in prs:
-                    stats['total'] += 1
-                    
-                    if pr['state'] == 'open':
-                        stats['open'] += 1
-                    else:
-                        stats['closed'] += 1
-                    
-                    if pr.get('merged_at'):
-                        stats['merged'] += 1
-            
-            except Exception as e:
-                self.logger.warning(f"⚠️  Erreur PRs pour {repo_name}: {e}")
-                continue
+        stats['closed'] = max(stats['total'] - stats['open'], 0)
         
         self.logger.info(f"✅ Total PRs: {stats['total']} (merged: {stats['merged']})")
         return stats
     
-    @rate_limit_aware
     def count_issues(self, repos: List[Dict]) -> Dict[str, int]:
         """
         Compte les Issues (créées par l'utilisateur)
         
+        Deux requêtes de recherche remplacent le parcours des dépôts.
+        Le qualificatif 'type:issue' exclut les PRs.
+        
         Args:
-            repos: Liste des dépôts
+            repos: Liste des dépôts (conservé pour compatibilité)
         
         Returns:
             Dictionnaire avec les stats d'issues
         """
         self.logger.info("❗ Comptage des Issues...")
         
+        query = f'author:{self.username} type:issue'
+        
         stats = {
-            'total': 0,
-            'open': 0,
+            'total': self._search_count(query),
+            'open': self._search_count(f'{query} state:open'),
             'closed': 0
         }
-        
-        for i, repo in enumerate(repos, 1):
-            repo_name = repo['full_name']
-            self.logger.debug(f"   [{i}/{len(repos)}] {repo_name}")
-            
-            try:
-                url = f'{self.base_url}/repos/{repo_name}/issues'
-                params = {
-                    'state': 'all',
-                    'creator': self.username,
-                    'per_page': 100
-                }
-                
-                response = requests.get(url, headers=self.headers, params=params, timeout=30)
-                
-                if response.status_code != 200:
-                    continue
-                
-                issues = response.json()
-                
-                # Filtrer les PRs (GitHub considère les PRs comme des issues)
-                issues = [i for i in issues if 'pull_request' not in i]
-                
-                for issue in issues:
-                    stats['total'] += 1
-                    
-                    if issue['state'] == 'open':
-                        stats['open'] += 1
-                    else:
-                        stats['closed'] += 1
-            
-            except Exception as e:
-                self.logger.warning(f"⚠️  Erreur issues pour {repo_name}: {e}")
-                continue
+        stats['closed'] = max(stats['total'] - stats['open'], 0)
         
         self.logger.info(f"✅ Total Issues: {stats['total']}")
         return stats
@@ -382,26 +773,24 @@ class GitHubStatsPrivate:
         Returns:
             Nombre de dépôts avec contributions récentes
         """
-        count = 0
         days_back = self.config.get('stats.days_back', 365)
         threshold_date = datetime.now() - timedelta(days=days_back)
         
-        for repo in repos:
-            updated_at = datetime.strptime(repo['updated_at'], '%Y-%m-%dT%H:%M:%SZ')
-            
-            if updated_at >= threshold_date:
-                count += 1
+        # Dates ISO 8601 de même format: la comparaison de chaînes suffit
+        threshold = threshold_date.strftime('%Y-%m-%dT%H:%M:%SZ')
+        count = sum(1 for repo in repos if repo['updated_at'] >= threshold)
         
         self.logger.info(f"🤝 Repos contribués: {count}")
         return count
     
-    @rate_limit_aware
     def get_language_stats(self, repos: List[Dict]) -> Dict[str, float]:
         """
         Récupère les statistiques des langages de programmation
         
         Analyse tous les repos pour déterminer les langages utilisés
-        et leur proportion.
+        et leur proportion. Les langages récupérés par get_all_repos
+        sont réutilisés ; l'API REST n'est appelée que pour les dépôts
+        qui n'en disposent pas.
         
         Args:
             repos: Liste des dépôts
@@ -414,47 +803,55 @@ class GitHubStatsPrivate:
         
         self.logger.info("💻 Analyse des langages...")
         
-        language_bytes = {}
+        language_bytes = Counter()
         
-        for i, repo in enumerate(repos, 1):
-            repo_name = repo['full_name']
-            self.logger.debug(f"   [{i}/{len(repos)}] {repo_name}")
-            
-            try:
-                url = f'{self.base_url}/repos/{repo_name}/languages'
-                response = requests.get(url, headers=self.headers, timeout=30)
-                
-                if response.status_code == 200:
-                    languages = response.json()
-                    
-                    for lang, bytes_count in languages.items():
-                        language_bytes[lang] = language_bytes.get(lang, 0) + bytes_count
-            
-            except Exception as e:
-                self.logger.warning(f"⚠️  Erreur langages pour {repo_name}: {e}")
-                continue
+        for languages in self._map_repos(self._fetch_repo_languages, repos):
+            language_bytes.update(languages)
         
-        # Convertir en pourcentages
         total_bytes = sum(language_bytes.values())
         if total_bytes == 0:
             return {}
         
-        language_percentages = {
-            lang: round((bytes_count / total_bytes) * 100, 2)
-            for lang, bytes_count in language_bytes.items()
+        # Convertir en pourcentages, triés par volume décroissant
+        scale = 100 / total_bytes
+        sorted_languages = {
+            lang: round(bytes_count * scale, 2)
+            for lang, bytes_count in language_bytes.most_common()
         }
         
-        # Trier par pourcentage décroissant
-        sorted_languages = dict(sorted(
-            language_percentages.items(),
-            key=lambda x: x[1],
-            reverse=True
-        ))
-        
         self.logger.info(f"✅ {len(sorted_languages)} langage(s) détecté(s)")
         return sorted_languages
     
-    @rate_limit_aware
+    def _fetch_repo_languages(self, repo: Dict) -> Dict[str, int]:
+        """
+        Récupère les langages d'un dépôt ({langage: octets})
+        
+        Args:
+            repo: Dépôt à analyser
+        
+        Returns:
+            Langages du dépôt (vide en cas d'erreur)
+        """
+        # Langages déjà récupérés par get_all_repos (GraphQL)
+        languages = repo.get('languages')
+        if languages is not None:
+            return languages
+        
+        repo_name = repo['full_name']
+        self.logger.debug(f"   {repo_name}")
+        
+        try:
+            url = f'{self.base_url}/repos/{repo_name}/languages'
+            status, languages = self._get_json(
+                url,
+                version=repo.get('pushed_at')
+            )
+            return languages if status == 200 else {}
+        
+        except Exception as e:
+            self.logger.warning(f"⚠️  Erreur langages pour {repo_name}: {e}")
+            return {}
+    
     def get_code_changes_stats(self, repos: List[Dict]) -> Dict[str, int]:
         """
         Récupère les statistiques d'ajout/suppression de code
@@ -476,43 +873,76 @@ class GitHubStatsPrivate:
             'total_changes': 0
         }
         
-        days_back = self.config.get('stats.days_back', 365)
-        since_date = datetime.now() - timedelta(days=days_back)
-        
-        for i, repo in enumerate(repos, 1):
-            repo_name = repo['full_name']
-            self.logger.debug(f"   [{i}/{len(repos)}] {repo_name}")
-            
-            try:
-                url = f'{self.base_url}/repos/{repo_name}/stats/contributors'
-                response = requests.get(url, headers=self.headers, timeout=30)
-                
-                # Les stats peuvent prendre du temps à générer
-                if response.status_code == 202:
-                    import time
-                    time.sleep(2)
-                    response = requests.get(url, headers=self.headers, timeout=30)
-                
-                if response.status_code == 200:
-                    contributors = response.json()
-                    
-                    for contributor in contributors:
-                        if contributor['author']['login'] == self.username:
-                            for week in contributor['weeks']:
-                                week_date = datetime.fromtimestamp(week['w'])
-                                if week_date >= since_date:
-                                    stats['additions'] += week['a']
-                                    stats['deletions'] += week['d']
-            
-            except Exception as e:
-                self.logger.warning(f"⚠️  Erreur stats code pour {repo_name}: {e}")
-                continue
+        for additions, deletions in self._map_repos(self._fetch_repo_code_changes, repos):
+            stats['additions'] += additions
+            stats['deletions'] += deletions
         
         stats['total_changes'] = stats['additions'] + stats['deletions']
         self.logger.info(f"✅ Modifications: +{stats['additions']} -{stats['deletions']}")
         return stats
     
-    @rate_limit_aware
+    def _fetch_repo_code_changes(self, repo: Dict) -> Tuple[int, int]:
+        """
+        Récupère les lignes ajoutées/supprimées par l'utilisateur dans un dépôt
+        
+        Args:
+            repo: Dépôt à analyser
+        
+        Returns:
+            Tuple (additions, deletions), (0, 0) en cas d'erreur
+        """
+        repo_name = repo['full_name']
+        self.logger.debug(f"   {repo_name}")
+        
+        additions = deletions = 0
+        since_ts = self._since_date().timestamp()
+        
+        try:
+            url = f'{self.base_url}/repos/{repo_name}/stats/contributors'
+            status, weeks = self._get_json(url, version=repo.get('pushed_at'), parse=self._own_weeks)
+            
+            # Les stats peuvent prendre du temps à générer (202): nouvelles
+            # tentatives espacées (2s, 4s, 8s...); seul ce worker attend, les
+            # autres dépôts continuent d'être traités par le pool
+            attempt = 1
+            while status == 202 and attempt <= STATS_MAX_POLLS:
+                time.sleep(min(30, 2 ** attempt))
+                status, weeks = self._get_json(url, version=repo.get('pushed_at'), parse=self._own_weeks)
+                attempt += 1
+            
+            if status == 202:
+                self.logger.warning(f"⚠️  Stats de code pas encore prêtes pour {repo_name}")
+            
+            if status == 200:
+                for week_ts, week_additions, week_deletions in weeks:
+                    if week_ts >= since_ts:
+                        additions += week_additions
+                        deletions += week_deletions
+        
+        except Exception as e:
+            self.logger.warning(f"⚠️  Erreur stats code pour {repo_name}: {e}")
+        
+        return additions, deletions
+    
+    def _own_weeks(self, response: requests.Response) -> List[List[int]]:
+        """
+        Extrait les semaines de l'utilisateur des statistiques de contributeurs
+        
+        Seules ses semaines sont conservées (et mises en cache), pas celles
+        de tous les contributeurs du dépôt.
+        
+        Args:
+            response: Réponse de /repos/{repo}/stats/contributors
+        
+        Returns:
+            Liste de [timestamp, additions, suppressions] par semaine
+        """
+        for contributor in json_loads(response.content):
+            if (contributor.get('author') or {}).get('login') == self.username:
+                return [[week['w'], week['a'], week['d']] for week in contributor['weeks']]
+        
+        return []
+    
     def get_activity_heatmap(self, repos: List[Dict]) -> Dict[int, Dict[int, int]]:
         """
         Génère une heatmap d'activité par jour/heure
@@ -528,44 +958,76 @@ class GitHubStatsPrivate:
         
         self.logger.info("🔥 Génération de la heatmap d'activité...")
         
-        heatmap = {day: {hour: 0 for hour in range(24)} for day in range(7)}
+        # Comptage par heure ('AAAA-MM-JJTHH'): chaque heure distincte n'est
+        # convertie qu'une fois, quel que soit son nombre de commits
+        per_hour = Counter()
+        for commit_dates in self._map_repos(self._fetch_repo_commit_dates, repos):
+            per_hour.update(date_str[:13] for date_str in commit_dates)
         
-        days_back = self.config.get('stats.days_back', 365)
-        since_date = datetime.now() - timedelta(days=days_back)
+        heatmap = {day: {hour: 0 for hour in range(24)} for day in range(7)}
         
-        for i, repo in enumerate(repos, 1):
-            repo_name = repo['full_name']
-            self.logger.debug(f"   [{i}/{len(repos)}] {repo_name}")
+        # Jour de la semaine calculé une fois par date (au plus une par jour
+        # de la période), heure lue directement dans la chaîne
+        weekdays = {}
+        for hour_str, count in per_hour.items():
+            day_str = hour_str[:10]
+            day = weekdays.get(day_str)
+            if day is None:
+                day = weekdays[day_str] = date.fromisoformat(day_str).weekday()
             
-            try:
-                url = f'{self.base_url}/repos/{repo_name}/commits'
-                params = {
-                    'author': self.username,
-                    'since': since_date.isoformat(),
-                    'per_page': 100
-                }
-                
-                response = requests.get(url, headers=self.headers, params=params, timeout=30)
-                
-                if response.status_code == 200:
-                    commits = response.json()
-                    
-                    for commit in commits:
-                        date_str = commit['commit']['author']['date']
-                        commit_date = datetime.strptime(date_str, '%Y-%m-%dT%H:%M:%SZ')
-                        
-                        day = commit_date.weekday()
-                        hour = commit_date.hour
-                        
-                        heatmap[day][hour] += 1
-            
-            except Exception as e:
-                self.logger.warning(f"⚠️  Erreur heatmap pour {repo_name}: {e}")
-                continue
+            heatmap[day][int(hour_str[11:13])] += count
         
         self.logger.info("✅ Heatmap générée")
         return heatmap
     
+    def _fetch_repo_commit_dates(self, repo: Dict) -> List[str]:
+        """
+        Récupère les dates (ISO 8601) des commits récents de l'utilisateur
+        
+        Args:
+            repo: Dépôt à analyser
+        
+        Returns:
+            Liste des dates de commit (vide en cas d'erreur)
+        """
+        repo_name = repo['full_name']
+        self.logger.debug(f"   {repo_name}")
+        
+        try:
+            url = f'{self.base_url}/repos/{repo_name}/commits'
+            params = {
+                'author': self.username,
+                'since': self._since_date().isoformat(),
+                'per_page': 100
+            }
+            
+            status, dates = self._get_json(
+                url, params,
+                version=repo.get('pushed_at'),
+                parse=self._commit_dates
+            )
+            return dates if status == 200 else []
+        
+        except Exception as e:
+            self.logger.warning(f"⚠️  Erreur heatmap pour {repo_name}: {e}")
+            return []
+    
+    @staticmethod
+    def _commit_dates(response: requests.Response) -> List[str]:
+        """
+        Extrait les dates d'une page de commits
+        
+        Seules les dates sont conservées (et mises en cache), pas les
+        objets commit complets (auteur, arbre, URLs, vérification...).
+        
+        Args:
+            response: Réponse de /repos/{repo}/commits
+        
+        Returns:
+            Liste des dates de commit (ISO 8601)
+        """
+        return [commit['commit']['author']['date'] for commit in json_loads(response.content)]
+    
     def calculate_all_stats(self) -> Dict[str, Any]:
         """
         Calcule toutes les statistiques disponibles
@@ -593,26 +1055,22 @@ class GitHubStatsPrivate:
         # Étoiles
         stats['stars'] = self.count_stars(repos)
         
-        # Commits
-        stats['commits_last_year'] = self.count_commits_last_year(repos)
-        
-        # Pull Requests
-        stats['prs'] = self.count_pull_requests(repos)
-        
-        # Issues
-        stats['issues'] = self.count_issues(repos)
-        
-        # Contributions
-        stats['contributed_repos'] = self.count_contributed_repos_last_year(repos)
-        
-        # Langages
-        stats['languages'] = self.get_language_stats(repos)
-        
-        # Modifications de code
-        stats['code_changes'] = self.get_code_changes_stats(repos)
-        
-        # Heatmap
-        stats['activity_heatmap'] = self.get_activity_heatmap(repos)
+        # Les calculs par dépôt sur la période n'interrogent que les
+        # dépôts actifs
+        active_repos = self._active_repos(repos)
+        self.logger.info(f"🗂️  {len(active_repos)}/{len(repos)} dépôt(s) actif(s) sur la période")
+        
+        # Commits, PRs, issues, contributions, langages, modifications de
+        # code et heatmap sont indépendants: calculés en parallèle si activé
+        stats.update(self._run_stats({
+            'commits_last_year': (self.count_commits_last_year, active_repos),
+            'prs': (self.count_pull_requests, repos),
+            'issues': (self.count_issues, repos),
+            'contributed_repos': (self.count_contributed_repos_last_year, repos),
+            'languages': (self.get_language_stats, repos),
+            'code_changes': (self.get_code_changes_stats, active_repos),
+            'activity_heatmap': (self.get_activity_heatmap, active_repos)
+        }))
         
         # Métadonnées
         stats['updated_at'] = datetime.now().isoformat()
@@ -624,6 +1082,43 @@ class GitHubStatsPrivate:
         
         return stats
     
+    async def acalculate_all_stats(self) -> Dict[str, Any]:
+        """
+        Variante asynchrone de calculate_all_stats()
+        
+        Le calcul (déjà parallélisé par threads sur la session partagée)
+        s'exécute dans un thread, sans bloquer la boucle d'événements.
+        
+        Returns:
+            Dictionnaire avec toutes les statistiques
+        
+        Example:
+            >>> stats = await stats_manager.acalculate_all_stats()
+        """
+        return await asyncio.to_thread(self.calculate_all_stats)
+    
+    def _run_stats(self, tasks: Dict[str, Tuple[Callable[[List[Dict]], Any], List[Dict]]]
+                   ) -> Dict[str, Any]:
+        """
+        Exécute des calculs de statistiques indépendants
+        
+        Avec advanced.parallel_requests, chaque calcul tourne dans son
+        propre thread: leurs temps d'attente réseau se superposent. Les
+        résultats gardent l'ordre des tâches.
+        
+        Args:
+            tasks: Dictionnaire {nom: (fonction, dépôts avec lesquels l'appeler)}
+        
+        Returns:
+            Dictionnaire {nom: résultat}
+        """
+        if not self.config.get('advanced.parallel_requests', False):
+            return {name: func(repos) for name, (func, repos) in tasks.items()}
+        
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {name: executor.submit(func, repos) for name, (func, repos) in tasks.items()}
+            return {name: future.result() for name, future in futures.items()}
+    
     def generate_profile_readme(self, stats: Dict[str, Any]) -> str:
         """
         Génère le README du profil avec les stats
@@ -636,100 +1131,104 @@ class GitHubStatsPrivate:
         """
         self.logger.info("📝 Génération du README...")
         
-        sections = self.config.get('readme.sections', [])
+        # Réglages lus une seule fois pour toute la génération
+        sections = set(self.config.get('readme.sections', []) or ())
         badge_style = self.config.get('readme.badge_style', 'for-the-badge')
+        include_update_time = self.config.get('readme.include_update_time', True)
+        username = self.username
         
-        readme = f"""# 👋 Bonjour, je suis {self.username}!
+        # Morceaux assemblés une seule fois à la fin (''.join)
+        parts = [f"""# 👋 Bonjour, je suis {username}!
 
 ## 📊 Statistiques GitHub Complètes (Publics + Privés)
 
 <div align="center">
 
-"""
+"""]
         
         # Section: Statistiques générales
         if 'stats' in sections:
-            readme += """### 🌟 Statistiques Générales
+            parts.append("""### 🌟 Statistiques Générales
 
 | Métrique | Valeur |
 |----------|--------|
-"""
-            readme += f"| ⭐ Total Stars Earned | **{format_number(stats['stars'])}** |\n"
-            readme += f"| 📝 Total Commits ({stats['period_days']} jours) | **{format_number(stats['commits_last_year'])}** |\n"
-            readme += f"| 🔀 Total PRs | **{format_number(stats['prs']['total'])}** |\n"
-            readme += f"| ❗ Total Issues | **{format_number(stats['issues']['total'])}** |\n"
-            readme += f"| 📦 Repos Contribués | **{format_number(stats['contributed_repos'])}** |\n"
+""")
+            parts.append(f"| ⭐ Total Stars Earned | **{format_number(stats['stars'])}** |\n")
+            parts.append(f"| 📝 Total Commits ({stats['period_days']} jours) | **{format_number(stats['commits_last_year'])}** |\n")
+            parts.append(f"| 🔀 Total PRs | **{format_number(stats['prs']['total'])}** |\n")
+            parts.append(f"| ❗ Total Issues | **{format_number(stats['issues']['total'])}** |\n")
+            parts.append(f"| 📦 Repos Contribués | **{format_number(stats['contributed_repos'])}** |\n")
             
             if stats['code_changes']['total_changes'] > 0:
-                readme += f"| ➕ Lignes Ajoutées | **{format_number(stats['code_changes']['additions'])}** |\n"
-                readme += f"| ➖ Lignes Supprimées | **{format_number(stats['code_changes']['deletions'])}** |\n"
+                parts.append(f"| ➕ Lignes Ajoutées | **{format_number(stats['code_changes']['additions'])}** |\n")
+                parts.append(f"| ➖ Lignes Supprimées | **{format_number(stats['code_changes']['deletions'])}** |\n")
             
-            readme += "\n"
+            parts.append("\n")
         
         # Section: Dépôts
         if 'repos' in sections:
-            readme += f"""### 📦 Dépôts
+            parts.append(f"""### 📦 Dépôts
 
 {create_badge_url('Total', stats['total_repos'], 'blue', badge_style)}
 {create_badge_url('Public', stats['public_repos'], 'green', badge_style)}
 {create_badge_url('Private', stats['private_repos'], 'orange', badge_style)}
 
-"""
+""")
         
         # Section: Pull Requests
         if 'prs' in sections:
-            readme += f"""### 🔀 Pull Requests Détaillées
+            parts.append(f"""### 🔀 Pull Requests Détaillées
 
 {create_badge_url('Total', stats['prs']['total'], 'blue', badge_style)}
 {create_badge_url('Open', stats['prs']['open'], 'green', badge_style)}
 {create_badge_url('Merged', stats['prs']['merged'], 'purple', badge_style)}
 {create_badge_url('Closed', stats['prs']['closed'], 'red', badge_style)}
 
-"""
+""")
         
         # Section: Issues
         if 'issues' in sections:
-            readme += f"""### ❗ Issues
+            parts.append(f"""### ❗ Issues
 
 {create_badge_url('Total', stats['issues']['total'], 'blue', badge_style)}
 {create_badge_url('Open', stats['issues']['open'], 'green', badge_style)}
 {create_badge_url('Closed', stats['issues']['closed'], 'red', badge_style)}
 
-"""
+""")
         
-        readme += "</div>\n\n---\n\n"
+        parts.append("</div>\n\n---\n\n")
         
         # Section: Langages
         if 'languages' in sections and stats['languages']:
-            readme += "## 💻 Langages les Plus Utilisés\n\n```\n"
+            parts.append("## 💻 Langages les Plus Utilisés\n\n```\n")
             
             for lang, percentage in list(stats['languages'].items())[:10]:
                 bar = generate_language_bar(percentage, length=40)
-                readme += f"{lang:<20} {bar}\n"
+                parts.append(f"{lang:<20} {bar}\n")
             
-            readme += "```\n\n---\n\n"
+            parts.append("```\n\n---\n\n")
         
         # Section: Heatmap d'activité
         if 'activity' in sections and stats['activity_heatmap']:
-            readme += "## 🔥 Heatmap d'Activité\n\n"
-            readme += generate_heatmap_ascii(stats['activity_heatmap'])
-            readme += "\n---\n\n"
+            parts.append("## 🔥 Heatmap d'Activité\n\n")
+            parts.append(generate_heatmap_ascii(stats['activity_heatmap']))
+            parts.append("\n---\n\n")
         
         # Section: Graphique ASCII
-        readme += "## 📈 Graphique ASCII\n\n```\n"
+        parts.append("## 📈 Graphique ASCII\n\n```\n")
         
         max_value = max(stats['stars'], stats['commits_last_year'] // 10, 1)
         
-        readme += f"Stars       : {generate_ascii_bar(stats['stars'], max_value, 50)} {format_number(stats['stars'])}\n"
-        readme += f"Commits     : {generate_ascii_bar(stats['commits_last_year'] // 10, max_value, 50)} {format_number(stats['commits_last_year'])}\n"
-        readme += f"PRs         : {generate_ascii_bar(stats['prs']['total'] * 3, max_value, 50)} {format_number(stats['prs']['total'])}\n"
-        readme += f"Issues      : {generate_ascii_bar(stats['issues']['total'] * 3, max_value, 50)} {format_number(stats['issues']['total'])}\n"
+        parts.append(f"Stars       : {generate_ascii_bar(stats['stars'], max_value, 50)} {format_number(stats['stars'])}\n")
+        parts.append(f"Commits     : {generate_ascii_bar(stats['commits_last_year'] // 10, max_value, 50)} {format_number(stats['commits_last_year'])}\n")
+        parts.append(f"PRs         : {generate_ascii_bar(stats['prs']['total'] * 3, max_value, 50)} {format_number(stats['prs']['total'])}\n")
+        parts.append(f"Issues      : {generate_ascii_bar(stats['issues']['total'] * 3, max_value, 50)} {format_number(stats['issues']['total'])}\n")
         
-        readme += "```\n\n---\n\n"
+        parts.append("```\n\n---\n\n")
         
         # Section: Technologies
         if 'technologies' in sections:
-            readme += """## 🛠️ Technologies & Compétences
+            parts.append("""## 🛠️ Technologies & Compétences
 
 ![Python](https://img.shields.io/badge/Python-3776AB?style=for-the-badge&logo=python&logoColor=white)
 ![JavaScript](https://img.shields.io/badge/JavaScript-F7DF1E?style=for-the-badge&logo=javascript&logoColor=black)
@@ -738,40 +1237,40 @@ class GitHubStatsPrivate:
 
 ---
 
-"""
+""")
         
         # Section: Contact
         if 'contact' in sections:
-            readme += f"""## 📫 Contact
+            parts.append(f"""## 📫 Contact
 
 [![Email](https://img.shields.io/badge/Email-D14836?style=for-the-badge&logo=gmail&logoColor=white)](mailto:contact@example.com)
-[![LinkedIn](https://img.shields.io/badge/LinkedIn-0077B5?style=for-the-badge&logo=linkedin&logoColor=white)](https://linkedin.com/in/{self.username})
-[![Twitter](https://img.shields.io/badge/Twitter-1DA1F2?style=for-the-badge&logo=twitter&logoColor=white)](https://twitter.com/{self.username})
+[![LinkedIn](https://img.shields.io/badge/LinkedIn-0077B5?style=for-the-badge&logo=linkedin&logoColor=white)](https://linkedin.com/in/{username})
+[![Twitter](https://img.shields.io/badge/Twitter-1DA1F2?style=for-the-badge&logo=twitter&logoColor=white)](https://twitter.com/{username})
 
 ---
 
-"""
+""")
         
         # Footer
-        readme += f"""<div align="center">
+        parts.append(f"""<div align="center">
 
-  <img src="https://komarev.com/ghpvc/?username={self.username}&style=for-the-badge&color=blue" alt="Profile Views" />
+  <img src="https://komarev.com/ghpvc/?username={username}&style=for-the-badge&color=blue" alt="Profile Views" />
 
 </div>
 
-"""
+""")
         
-        if self.config.get('readme.include_update_time', True):
+        if include_update_time:
             update_time = datetime.now().strftime('%d/%m/%Y à %H:%M')
-            readme += f"""<div align="center">
+            parts.append(f"""<div align="center">
 
   <sub>📊 Stats mises à jour automatiquement le {update_time}</sub>
 
 </div>
-"""
+""")
         
         self.logger.info("✅ README généré")
-        return readme
+        return ''.join(parts)
     
     @rate_limit_aware
     def update_profile_readme(self, content: str) -> Dict:
@@ -791,9 +1290,9 @@ class GitHubStatsPrivate:
         # Récupérer le SHA du fichier actuel
         sha = None
         try:
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = self._request('GET', url)
             if response.status_code == 200:
-                sha = response.json()['sha']
+                sha = json_loads(response.content)['sha']
                 self.logger.debug(f"   SHA du fichier actuel: {sha[:7]}...")
         except Exception as e:
             self.logger.warning(f"⚠️  Impossible de récupérer le SHA: {e}")
@@ -811,9 +1310,21 @@ class GitHubStatsPrivate:
             data['sha'] = sha
         
         # Envoyer la requête
-        response = requests.put(url, headers=self.headers, json=data, timeout=30)
+        response = self._request('PUT', url, json=data)
         response.raise_for_status()
         
         self.logger.info("✅ README mis à jour sur GitHub")
-        return response.json()
-
+        return json_loads(response.content)
+    
+    def close(self):
+        """
+        Libère les ressources: connexions HTTP et base de cache
+        """
+        self.session.close()
+        self.cache.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
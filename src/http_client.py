@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+HTTP Client Module
+==================
+
+Sessions HTTP partagées pour les appels à l'API GitHub.
+
+Fonctionnalités:
+- Connexions keep-alive réutilisées (une poignée de main TLS par connexion)
+- Pool de connexions dimensionné pour les requêtes parallèles
+- Nouvelles tentatives automatiques sur les erreurs transitoires (429, 5xx)
+
+Une session par défaut (SESSION) est disponible au niveau du module.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Optional
+
+
+# Erreurs transitoires pour lesquelles une nouvelle tentative est faite
+RETRY_STATUSES = (429, 502, 503, 504)
+
+
+def create_session(pool_size: int = 10, headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """
+    Crée une session HTTP avec pool de connexions et nouvelles tentatives
+    
+    Les requêtes idempotentes (GET, PUT...) sont retentées jusqu'à 3 fois
+    avec un délai exponentiel (0.3s, 0.6s, 1.2s) sur les erreurs de
+    connexion et les statuts RETRY_STATUSES. L'en-tête Retry-After est
+    respecté. Après la dernière tentative, la réponse est retournée telle
+    quelle (pas d'exception).
+    
+    Args:
+        pool_size: Nombre maximum de connexions gardées ouvertes
+        headers: En-têtes ajoutés à chaque requête
+    
+    Returns:
+        Session configurée
+    
+    Example:
+        >>> session = create_session(20, {'Authorization': 'token ghp_...'})
+        >>> response = session.get('https://api.github.com/user')
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=RETRY_STATUSES,
+        raise_on_status=False
+    )
+    
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_size,
+        max_retries=retry
+    ))
+    
+    if headers:
+        session.headers.update(headers)
+    
+    return session
+
+
+# Session partagée par défaut
+SESSION = create_session()
@@ -11,17 +11,78 @@ L'API GitHub impose des limites:
 
 Ce module:
 - Vérifie automatiquement le rate limit restant
+- Suit les en-têtes X-RateLimit-* des réponses pour éviter les appels à /rate_limit
 - Met en pause si nécessaire
+- Étale les requêtes (seau à jetons) quand le quota restant devient faible
+- Adapte le nombre de requêtes simultanées (ConcurrencyController)
+- Coupe les nouvelles tentatives pendant une panne prolongée (CircuitBreaker)
 - Affiche des warnings avant d'atteindre la limite
 - Peut être utilisé comme décorateur
 """
 
 import time
+import random
+import threading
 import requests
+from collections import deque
 from datetime import datetime
-from typing import Dict, Callable
+from typing import Dict, Callable, Mapping, Optional
 from functools import wraps
 
+from .http_client import SESSION
+from .utils import json_loads
+
+
+def is_rate_limited(response: requests.Response) -> bool:
+    """
+    Indique si une réponse est un refus pour cause de rate limit
+    
+    Un 429, ou un 403 accompagné de Retry-After (limite secondaire) ou
+    d'un quota épuisé (X-RateLimit-Remaining: 0). Les autres 403
+    (permissions) ne sont pas concernés.
+    
+    Args:
+        response: Réponse HTTP
+    
+    Returns:
+        True si la requête peut être retentée après une attente
+    """
+    if response.status_code == 429:
+        return True
+    
+    return response.status_code == 403 and (
+        'Retry-After' in response.headers
+        or response.headers.get('X-RateLimit-Remaining') == '0'
+    )
+
+
+def retry_delay(headers: Mapping[str, str], default: float) -> float:
+    """
+    Délai à respecter avant de retenter une requête refusée
+    
+    Retry-After est prioritaire; sinon, si le quota est épuisé, attente
+    jusqu'à X-RateLimit-Reset; à défaut, le délai par défaut (backoff de
+    l'appelant). Une gigue (jusqu'à 1s, ou 10% des longues attentes)
+    évite que les threads repartent tous au même instant.
+    
+    Args:
+        headers: En-têtes de la réponse refusée
+        default: Délai utilisé si les en-têtes ne donnent aucune indication
+    
+    Returns:
+        Délai en secondes
+    """
+    wait_seconds = default
+    
+    retry_after = headers.get('Retry-After')
+    reset = headers.get('X-RateLimit-Reset')
+    if retry_after and retry_after.isdigit():
+        wait_seconds = int(retry_after)
+    elif headers.get('X-RateLimit-Remaining') == '0' and reset and reset.isdigit():
+        wait_seconds = max(0, int(reset) - time.time())
+    
+    return wait_seconds + random.uniform(0, max(1, wait_seconds * 0.1))
+
 
 class RateLimitHandler:
     """
@@ -36,25 +97,229 @@ class RateLimitHandler:
         min_remaining (int): Seuil minimal avant d'attendre
     """
     
-    def __init__(self, headers: Dict, min_remaining: int = 100):
+    # Attributs fixes: instances plus compactes, accès plus rapides
+    __slots__ = (
+        'headers', 'session', 'base_url', 'min_remaining', 'check_interval',
+        'max_per_minute', '_last_check', '_last_rate_info', '_last_search_info',
+        '_tokens', '_rate', '_last_refill', '_bucket_lock', '_pending_sync', '_window',
+        '_cancel_event'
+    )
+    
+    def __init__(self, headers: Dict, min_remaining: int = 100,
+                 session: Optional[requests.Session] = None,
+                 check_interval: float = 60, max_per_minute: int = 900):
         """
         Initialise le gestionnaire de rate limit
         
         Args:
             headers: Headers contenant le token d'authentification
             min_remaining: Nombre minimum de requêtes avant d'attendre
+            session: Session HTTP à réutiliser (connexions keep-alive
+                partagées avec l'appelant); la session partagée du module
+                http_client sinon
+            check_interval: Durée de validité (secondes) de l'info connue
+                avant un nouvel appel à /rate_limit
+            max_per_minute: Nombre maximum de requêtes sur 60 secondes
+                glissantes (limite secondaire de GitHub)
         """
         self.headers = headers
+        self.session = session or SESSION
         self.base_url = 'https://api.github.com'
         self.min_remaining = min_remaining
-        self._last_check = None
+        self.check_interval = check_interval  # Durée de validité de l'info (secondes)
+        self._last_check = None  # time.monotonic() de la dernière mise à jour
         self._last_rate_info = None
+        self._last_search_info = None
+        
+        # Seau à jetons (voir acquire), initialisé au premier appel
+        self._tokens = None
+        self._rate = 5000 / 3600.0  # Jetons regagnés par seconde
+        self._last_refill = None
+        self._bucket_lock = threading.Lock()
+        self._pending_sync = None  # Dernier état lu dans les en-têtes, appliqué par acquire
+        
+        # Fenêtre glissante: créneaux (monotonic) réservés sur les 60 dernières secondes
+        self.max_per_minute = max_per_minute
+        self._window = deque()
+        
+        # Interrompt l'attente en cours (voir cancel_wait)
+        self._cancel_event = threading.Event()
+    
+    @staticmethod
+    def _parse_bucket(bucket: Dict) -> Dict[str, any]:
+        """
+        Convertit un quota de /rate_limit en dictionnaire de rate info
+        
+        Args:
+            bucket: Entrée de 'resources' (core, search...)
+        
+        Returns:
+            Dictionnaire remaining/limit/reset/reset_datetime/used
+        """
+        return {
+            'remaining': bucket['remaining'],
+            'limit': bucket['limit'],
+            'reset': bucket['reset'],
+            'reset_datetime': datetime.fromtimestamp(bucket['reset']),
+            'used': bucket['used']
+        }
+    
+    def update_from_headers(self, headers: Dict) -> None:
+        """
+        Met à jour l'état du rate limit depuis les en-têtes d'une réponse
+        
+        Chaque réponse de l'API contient X-RateLimit-Remaining/Limit/Reset/Used:
+        les mémoriser évite d'interroger /rate_limit pendant un traitement.
+        
+        Args:
+            headers: En-têtes de la réponse HTTP
+        """
+        remaining = headers.get('X-RateLimit-Remaining')
+        limit = headers.get('X-RateLimit-Limit')
+        if remaining is None or not limit:
+            # État partiel (sans limite): inexploitable pour le seau
+            return
+        
+        # Seuls les quotas 'core' et 'search' sont suivis
+        resource = headers.get('X-RateLimit-Resource', 'core')
+        if resource not in ('core', 'search'):
+            return
+        
+        rate_info = self._parse_bucket({
+            'remaining': int(remaining),
+            'limit': int(limit),
+            'reset': int(headers.get('X-RateLimit-Reset', 0)),
+            'used': int(headers.get('X-RateLimit-Used', 0))
+        })
+        
+        if resource == 'search':
+            self._last_search_info = rate_info
+        else:
+            self._last_rate_info = rate_info
+            self._last_check = time.monotonic()
+            
+            # Le quota réel fait foi: le seau sera recalé sur cette réponse
+            # au prochain acquire(), sous le verrou du seau (les threads
+            # des réponses ne le modifient jamais directement)
+            self._pending_sync = rate_info
     
-    def check_rate_limit(self) -> Dict[str, any]:
+    def _sync_bucket(self, rate_info: Dict[str, any]) -> None:
+        """
+        Recale le seau à jetons sur un état du quota 'core'
+        
+        S'il reste des requêtes au-delà de min_remaining, le seau en contient
+        autant et se remplit dès maintenant. Sinon le quota est épuisé: rien
+        ne revient avant le reset, où le seau repart plein.
+        
+        À appeler avec _bucket_lock acquis.
+        
+        Args:
+            rate_info: Dictionnaire au format de check_rate_limit()
+        """
+        if rate_info['limit'] <= 0:
+            return
+        
+        now = time.monotonic()
+        self._rate = rate_info['limit'] / 3600.0
+        headroom = rate_info['remaining'] - self.min_remaining
+        
+        if headroom > 0:
+            self._tokens = float(headroom)
+            self._last_refill = now
+        else:
+            # Même attente que wait_if_needed: jusqu'au reset (+5s de marge)
+            until_reset = max(0.0, rate_info['reset'] - time.time() + 5)
+            self._tokens = self._capacity()
+            self._last_refill = now + until_reset
+    
+    def _capacity(self) -> float:
+        """
+        Retourne la capacité du seau (quota horaire moins min_remaining)
+        
+        Returns:
+            Nombre maximum de jetons, au moins 1
+        """
+        return max(1.0, self._rate * 3600.0 - self.min_remaining)
+    
+    def acquire(self, n: int = 1) -> float:
+        """
+        Réserve n requêtes du quota 'core' (seau à jetons)
+        
+        Le seau contient les requêtes restantes au-delà de min_remaining et
+        se remplit en continu au rythme du quota (limit/3600 par seconde).
+        Tant qu'il reste des jetons, l'appel est immédiat; sinon il attend
+        juste le temps de regagner les jetons manquants, ce qui étale les
+        requêtes au lieu de tout bloquer jusqu'au reset. Si le quota réel
+        est épuisé, l'attente va jusqu'au reset.
+        
+        En plus du quota horaire, au plus max_per_minute requêtes sont
+        admises sur 60 secondes glissantes: les limites secondaires de
+        GitHub (par minute) ne sont pas visibles dans X-RateLimit-*.
+        
+        Les jetons et le créneau sont réservés sous le verrou; l'attente se
+        fait après l'avoir relâché, pour ne pas bloquer les autres threads.
+        
+        Args:
+            n: Nombre de requêtes à réserver
+        
+        Returns:
+            Temps d'attente (secondes), 0 si aucun
+        
+        Example:
+            >>> limiter.acquire()
+            >>> response = session.get(url)
+        """
+        with self._bucket_lock:
+            pending, self._pending_sync = self._pending_sync, None
+            if pending is not None:
+                self._sync_bucket(pending)
+            if self._tokens is None:
+                self._sync_bucket(self.check_rate_limit())
+            
+            now = time.monotonic()
+            if now > self._last_refill:
+                self._tokens = min(
+                    self._capacity(),
+                    self._tokens + (now - self._last_refill) * self._rate
+                )
+                self._last_refill = now
+            
+            # Réservation: un solde négatif est une dette, regagnée au
+            # rythme du quota (après le reset si le quota est épuisé)
+            self._tokens -= n
+            start = self._last_refill + max(0.0, -self._tokens) / self._rate
+            
+            # Fenêtre glissante de 60s: créneaux réservés, dans l'ordre
+            window = self._window
+            while window and window[0] <= now - 60:
+                window.popleft()
+            
+            for _ in range(n):
+                if window:
+                    start = max(start, window[-1])
+                if len(window) >= self.max_per_minute:
+                    start = max(start, window[-self.max_per_minute] + 60)
+                window.append(start)
+            
+            wait_seconds = max(0.0, start - now)
+        
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+        
+        return wait_seconds
+    
+    def check_rate_limit(self, force: bool = False) -> Dict[str, any]:
         """
         Vérifie l'état actuel du rate limit via l'API
         
         Cette requête ne compte pas dans le rate limit.
+        Si l'info connue (en-têtes de la dernière réponse ou dernier appel)
+        date de moins de check_interval secondes, elle est retournée sans
+        requête. Le quota 'search' (30 requêtes/minute) est mémorisé au
+        passage, voir get_search_rate_info().
+        
+        Args:
+            force: Interroger l'API même si l'info en mémoire est récente
         
         Returns:
             Dictionnaire avec les informations de rate limit:
@@ -67,26 +332,24 @@ class RateLimitHandler:
         Raises:
             requests.RequestException: En cas d'erreur de connexion
         """
+        if not force and self._is_fresh():
+            return self._last_rate_info
+        
         try:
-            response = requests.get(
+            response = self.session.get(
                 f'{self.base_url}/rate_limit',
                 headers=self.headers,
                 timeout=10
             )
             response.raise_for_status()
             
-            data = response.json()
-            core = data['resources']['core']
+            resources = json_loads(response.content)['resources']
+            rate_info = self._parse_bucket(resources['core'])
             
-            rate_info = {
-                'remaining': core['remaining'],
-                'limit': core['limit'],
-                'reset': core['reset'],
-                'reset_datetime': datetime.fromtimestamp(core['reset']),
-                'used': core['used']
-            }
+            if 'search' in resources:
+                self._last_search_info = self._parse_bucket(resources['search'])
             
-            self._last_check = datetime.now()
+            self._last_check = time.monotonic()
             self._last_rate_info = rate_info
             
             return rate_info
@@ -103,6 +366,23 @@ class RateLimitHandler:
                 'used': 0
             }
     
+    def _is_fresh(self) -> bool:
+        """
+        Indique si l'info de rate limit en mémoire est encore récente
+        
+        Returns:
+            True si elle date de moins de check_interval secondes et que
+            le quota n'a pas été réinitialisé depuis
+        """
+        if self._last_check is None or not self._last_rate_info:
+            return False
+        
+        # Après le reset, 'remaining' n'a plus de sens
+        if self._last_rate_info['reset'] and self._last_rate_info['reset'] <= time.time():
+            return False
+        
+        return time.monotonic() - self._last_check < self.check_interval
+    
     def get_cached_rate_info(self) -> Dict[str, any]:
         """
         Retourne la dernière info de rate limit sans faire de requête
@@ -114,7 +394,27 @@ class RateLimitHandler:
         """
         return self._last_rate_info
     
-    def wait_if_needed(self, force_check: bool = False) -> bool:
+    def get_search_rate_info(self) -> Dict[str, any]:
+        """
+        Retourne l'état du quota 'search' (/search/*)
+        
+        Interroge l'API si aucune information n'a encore été récupérée.
+        
+        Returns:
+            Dictionnaire au même format que check_rate_limit()
+        """
+        if self._last_search_info is None:
+            self.check_rate_limit()
+        
+        return self._last_search_info or {
+            'remaining': 30,
+            'limit': 30,
+            'reset': 0,
+            'reset_datetime': datetime.now(),
+            'used': 0
+        }
+    
+    def wait_if_needed(self, force_check: bool = False, resource: str = 'core') -> bool:
         """
         Attend si le rate limit est proche de la limite
         
@@ -123,6 +423,7 @@ class RateLimitHandler:
         
         Args:
             force_check: Force la vérification même si récente
+            resource: Quota à surveiller ('core' ou 'search')
         
         Returns:
             True si on a attendu, False sinon
@@ -132,13 +433,11 @@ class RateLimitHandler:
             >>> limiter.wait_if_needed()
             >>> # Continue avec les requêtes API
         """
-        # Vérifier seulement toutes les 10 requêtes pour optimiser
-        if not force_check and self._last_check:
-            time_since_check = (datetime.now() - self._last_check).total_seconds()
-            if time_since_check < 5:  # Moins de 5 secondes
-                return False
+        if resource == 'search':
+            return self._wait_for_search()
         
-        rate_info = self.check_rate_limit()
+        # L'info récente (en-têtes des réponses) évite un appel à /rate_limit
+        rate_info = self.check_rate_limit(force=force_check)
         
         # Afficher un warning si on approche de la limite
         if rate_info['remaining'] < 500:
@@ -147,7 +446,7 @@ class RateLimitHandler:
         # Attendre si on est en dessous du seuil
         if rate_info['remaining'] < self.min_remaining:
             reset_time = rate_info['reset_datetime']
-            wait_seconds = (reset_time - datetime.now()).total_seconds()
+            wait_seconds = rate_info['reset'] - time.time()
             
             if wait_seconds > 0:
                 wait_minutes = int(wait_seconds / 60)
@@ -163,31 +462,87 @@ class RateLimitHandler:
         
         return False
     
-    def _wait_with_progress(self, seconds: float):
+    def _wait_for_search(self) -> bool:
+        """
+        Attend le reset du quota 'search' s'il est épuisé
+        
+        Le quota est décrémenté localement à chaque appel pour ne pas
+        interroger /rate_limit avant chaque recherche.
+        
+        Returns:
+            True si on a attendu, False sinon
+        """
+        search_info = self.get_search_rate_info()
+        waited = False
+        
+        if search_info['remaining'] < 1:
+            wait_seconds = search_info['reset'] - time.time()
+            
+            if wait_seconds > 0:
+                print(f"\n⏳ Quota de recherche atteint, reprise à {search_info['reset_datetime'].strftime('%H:%M:%S')}")
+                self._wait_with_progress(wait_seconds + 1)
+                waited = True
+            
+            # Relire le quota après le reset
+            self._last_search_info = None
+            search_info = self.get_search_rate_info()
+        
+        search_info['remaining'] -= 1
+        search_info['used'] += 1
+        self._last_search_info = search_info
+        
+        return waited
+    
+    def cancel_wait(self) -> None:
+        """
+        Interrompt l'attente en cours (depuis un autre thread)
+        
+        Les requêtes reprennent immédiatement, au risque d'un refus si le
+        quota n'a pas encore été réinitialisé.
+        """
+        self._cancel_event.set()
+    
+    def _wait_with_progress(self, seconds: float, tick: float = 5) -> bool:
         """
         Attend en affichant une barre de progression
         
+        La barre est rafraîchie toutes les tick secondes; entre deux
+        rafraîchissements, le thread dort sur un Event (interruptible par
+        cancel_wait, et par Ctrl-C dans le thread principal).
+        
         Args:
             seconds: Nombre de secondes à attendre
+            tick: Intervalle de rafraîchissement de la barre (secondes)
+        
+        Returns:
+            True si l'attente est allée à son terme, False si interrompue
         """
-        start_time = time.time()
-        end_time = start_time + seconds
+        # Barres construites une fois, découpées à chaque tick
+        bar_length = 30
+        full_bar = '█' * bar_length
+        empty_bar = '░' * bar_length
+        scale = bar_length / seconds if seconds > 0 else 0
         
-        while time.time() < end_time:
-            remaining = end_time - time.time()
-            progress = (seconds - remaining) / seconds
-            
-            # Barre de progression
-            bar_length = 30
-            filled = int(bar_length * progress)
-            bar = '█' * filled + '░' * (bar_length - filled)
+        # Horloge monotone: insensible aux ajustements de l'heure système
+        end_time = time.monotonic() + seconds
+        remaining = seconds
+        self._cancel_event.clear()
+        
+        while remaining > 0:
+            filled = min(bar_length, int((seconds - remaining) * scale))
             
             # Afficher (écrase la ligne précédente)
-            print(f'\r   [{bar}] {int(remaining)}s restantes', end='', flush=True)
+            print(f'\r   [{full_bar[:filled]}{empty_bar[filled:]}] {int(remaining)}s restantes', end='', flush=True)
+            
+            # Dernier tick raccourci: pas de dépassement de l'échéance
+            if self._cancel_event.wait(min(tick, remaining)):
+                print('\n   ⏹️  Attente interrompue\n')
+                return False
             
-            time.sleep(1)
+            remaining = end_time - time.monotonic()
         
-        print('\r   ' + '█' * 30 + ' ✅ Reprise des requêtes!\n')
+        print(f'\r   {full_bar} ✅ Reprise des requêtes!\n')
+        return True
     
     def get_status_message(self) -> str:
         """
@@ -209,6 +564,171 @@ class RateLimitHandler:
 """
 
 
+class ConcurrencyController:
+    """
+    Limite adaptative du nombre de requêtes simultanées (AIMD)
+    
+    Comme le contrôle de congestion TCP: la limite augmente d'une unité par
+    "tour" de requêtes réussies (+1/limite à chaque succès) et est divisée
+    par deux sur un refus pour rate limit, une erreur serveur ou une
+    latence moyenne (fenêtre glissante) au-delà de la cible. Les limites
+    secondaires de GitHub portent justement sur la concurrence.
+    
+    S'utilise comme context manager autour d'une requête (thread-safe):
+    
+        >>> controller = ConcurrencyController(initial=10, maximum=20)
+        >>> with controller:
+        ...     start = time.monotonic()
+        ...     response = session.get(url)
+        >>> controller.record(time.monotonic() - start, response)
+    
+    Attributes:
+        limit (float): Nombre de requêtes simultanées autorisées
+        minimum (int): Limite basse
+        maximum (int): Limite haute
+        target_latency (float): Latence moyenne cible (secondes)
+    """
+    
+    def __init__(self, initial: int = 10, minimum: int = 1, maximum: int = 20,
+                 target_latency: float = 5.0, window: int = 32):
+        """
+        Initialise le contrôleur
+        
+        Args:
+            initial: Limite de départ
+            minimum: Limite basse
+            maximum: Limite haute
+            target_latency: Latence moyenne (secondes) au-delà de laquelle
+                la limite est réduite
+            window: Nombre de latences récentes prises en compte
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = float(min(max(initial, minimum), maximum))
+        self.target_latency = target_latency
+        self._latencies = deque(maxlen=window)
+        self._last_cut = float('-inf')  # time.monotonic() de la dernière réduction
+        self._in_flight = 0
+        self._cond = threading.Condition()
+    
+    def __enter__(self):
+        with self._cond:
+            while self._in_flight >= int(self.limit):
+                self._cond.wait()
+            self._in_flight += 1
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+        return False
+    
+    def record(self, latency: float, response: requests.Response) -> None:
+        """
+        Ajuste la limite après une requête
+        
+        Une seule réduction par épisode de congestion: les requêtes
+        lancées avant la dernière réduction (déjà en vol à ce moment) sont
+        ignorées, sinon une rafale de refus ramènerait la limite au minimum.
+        
+        Args:
+            latency: Durée de la requête (secondes)
+            response: Réponse reçue
+        """
+        congested = is_rate_limited(response) or response.status_code >= 500
+        started = time.monotonic() - latency
+        
+        with self._cond:
+            if started < self._last_cut:
+                return
+            
+            self._latencies.append(latency)
+            mean_latency = sum(self._latencies) / len(self._latencies)
+            
+            if congested or mean_latency > self.target_latency:
+                self.limit = max(self.minimum, self.limit * 0.5)
+                self._last_cut = time.monotonic()
+                # Repartir d'une fenêtre vide pour les latences
+                self._latencies.clear()
+            else:
+                self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+                self._cond.notify_all()
+
+
+class CircuitOpenError(RuntimeError):
+    """Levée quand le disjoncteur est ouvert: l'appel n'est pas tenté"""
+
+
+class CircuitBreaker:
+    """
+    Disjoncteur sur les échecs répétés de l'API (403/429, 5xx, réseau)
+    
+    Après threshold échecs consécutifs, les appels sont refusés
+    (CircuitOpenError) pendant un délai qui double à chaque nouvel échec
+    (base_cooldown, 2x, 4x... plafonné à max_cooldown). Une fois le délai
+    écoulé, un appel est de nouveau tenté; le premier succès referme le
+    disjoncteur. Évite de gaspiller le quota en nouvelles tentatives
+    pendant une panne. Thread-safe.
+    
+    Attributes:
+        threshold (int): Nombre d'échecs consécutifs avant ouverture
+        base_cooldown (float): Première durée d'ouverture (secondes)
+        max_cooldown (float): Durée d'ouverture maximale (secondes)
+    """
+    
+    def __init__(self, threshold: int = 5, base_cooldown: float = 60,
+                 max_cooldown: float = 900):
+        """
+        Initialise le disjoncteur (fermé)
+        
+        Args:
+            threshold: Nombre d'échecs consécutifs avant ouverture
+            base_cooldown: Première durée d'ouverture (secondes)
+            max_cooldown: Durée d'ouverture maximale (secondes)
+        """
+        self.threshold = threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self._failures = 0
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+    
+    def check(self) -> None:
+        """
+        Vérifie qu'un appel peut être tenté
+        
+        Raises:
+            CircuitOpenError: Si le disjoncteur est ouvert
+        """
+        remaining = self._open_until - time.monotonic()
+        if remaining > 0:
+            raise CircuitOpenError(
+                f"API GitHub indisponible ({self._failures} échecs consécutifs), "
+                f"nouvel essai dans {int(remaining)}s"
+            )
+    
+    def record_success(self) -> None:
+        """Referme le disjoncteur"""
+        with self._lock:
+            self._failures = 0
+            self._open_until = 0.0
+    
+    def record_failure(self) -> None:
+        """Compte un échec et ouvre le disjoncteur au-delà du seuil"""
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.threshold:
+                cooldown = min(self.base_cooldown * 2 ** (self._failures - self.threshold),
+                               self.max_cooldown)
+                self._open_until = time.monotonic() + cooldown
+                print(f"🔌 {self._failures} échecs consécutifs, appels suspendus pendant {int(cooldown)}s")
+
+
+# Disjoncteur partagé par toutes les fonctions décorées avec with_retry
+CIRCUIT_BREAKER = CircuitBreaker()
+
+
 def rate_limit_aware(func: Callable) -> Callable:
     """
     Décorateur pour gérer automatiquement le rate limiting
@@ -244,11 +764,17 @@ def with_retry(max_retries: int = 3, delay: int = 2):
     """
     Décorateur pour réessayer en cas d'erreur de rate limit
     
-    Réessaie automatiquement en cas d'erreur 403 (rate limit).
+    Réessaie automatiquement en cas de rate limit (429, ou 403 reconnu
+    par is_rate_limited), après le délai indiqué par la réponse (voir
+    retry_delay). Un 403 de permission est relevé aussitôt. Les échecs
+    (rate limit, 5xx, erreurs réseau) alimentent le disjoncteur partagé
+    CIRCUIT_BREAKER: tant qu'il est ouvert, CircuitOpenError est levée
+    sans tenter l'appel.
     
     Args:
         max_retries: Nombre maximum de tentatives
-        delay: Délai entre les tentatives (secondes)
+        delay: Délai de base entre les tentatives (secondes), doublé à
+            chaque tentative si la réponse n'indique pas de délai
     
     Returns:
         Décorateur configuré
@@ -265,23 +791,36 @@ def with_retry(max_retries: int = 3, delay: int = 2):
             last_exception = None
             
             for attempt in range(max_retries):
+                CIRCUIT_BREAKER.check()
+                
                 try:
-                    return func(*args, **kwargs)
+                    result = func(*args, **kwargs)
+                    CIRCUIT_BREAKER.record_success()
+                    return result
                 
                 except requests.exceptions.HTTPError as e:
-                    if e.response.status_code == 403:
-                        # Rate limit atteint
-                        print(f"⚠️  Rate limit atteint, tentative {attempt + 1}/{max_retries}")
-                        
-                        if attempt < max_retries - 1:
-                            wait_time = delay * (2 ** attempt)  # Backoff exponentiel
-                            time.sleep(wait_time)
-                        
-                        last_exception = e
-                    else:
+                    response = e.response
+                    if response is None or not is_rate_limited(response):
+                        # 403 de permission, 404...: réessayer ne changerait
+                        # rien et ne dit rien de l'état de l'API
+                        if response is not None and response.status_code >= 500:
+                            CIRCUIT_BREAKER.record_failure()
                         raise
+                    
+                    # Rate limit atteint
+                    CIRCUIT_BREAKER.record_failure()
+                    print(f"⚠️  Rate limit atteint, tentative {attempt + 1}/{max_retries}")
+                    
+                    if attempt < max_retries - 1:
+                        # Délai indiqué par GitHub, sinon backoff exponentiel
+                        time.sleep(retry_delay(response.headers, delay * (2 ** attempt)))
+                    
+                    last_exception = e
                 
                 except Exception as e:
+                    if isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+                        CIRCUIT_BREAKER.record_failure()
+                    
                     last_exception = e
                     if attempt < max_retries - 1:
                         time.sleep(delay)
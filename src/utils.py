@@ -11,17 +11,37 @@ Inclut:
 - Formatage de dates
 - Validation d'entrées
 - Helpers pour les statistiques
+- Sérialisation JSON (orjson si disponible)
 """
 
+from bisect import bisect_right
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Union
+import json
 import re
 
+try:
+    import orjson
+except ImportError:  # orjson est optionnel, repli sur le module json
+    orjson = None
 
+# Motifs de validation compilés une seule fois à l'import
+# Les tokens GitHub commencent par ghp_, gho_, ghu_, ghs_, ou ghr_
+_TOKEN_PREFIXES = ('ghp_', 'gho_', 'ghu_', 'ghs_', 'ghr_')
+_TOKEN_RE = re.compile(r'gh[pousr]_[a-zA-Z0-9]{36}')
+_USERNAME_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-')
+
+
+@lru_cache(maxsize=1024, typed=True)
 def format_number(num: int) -> str:
     """
     Formate un nombre avec des séparateurs de milliers
     
+    Le résultat est mis en cache (typed: 1 et 1.0 restent distincts).
+    
     Args:
         num: Nombre à formater
     
@@ -102,25 +122,16 @@ def format_relative_time(date: datetime) -> str:
     Returns:
         Temps relatif en français
     """
-    now = datetime.now()
-    diff = now - date
-    
-    if diff.days > 365:
-        years = diff.days // 365
-        return f"il y a {years} an{'s' if years > 1 else ''}"
-    elif diff.days > 30:
-        months = diff.days // 30
-        return f"il y a {months} mois"
-    elif diff.days > 0:
-        return f"il y a {diff.days} jour{'s' if diff.days > 1 else ''}"
-    elif diff.seconds > 3600:
-        hours = diff.seconds // 3600
-        return f"il y a {hours} heure{'s' if hours > 1 else ''}"
-    elif diff.seconds > 60:
-        minutes = diff.seconds // 60
-        return f"il y a {minutes} minute{'s' if minutes > 1 else ''}"
-    else:
-        return "à l'instant"
+    diff = datetime.now() - date
+    amounts = (diff.days, diff.seconds)
+    
+    for field, threshold, divisor, unit, plural in _RELATIVE_UNITS:
+        amount = amounts[field]
+        if amount > threshold:
+            count = amount // divisor
+            return f"il y a {count} {unit}{plural if count > 1 else ''}"
+    
+    return "à l'instant"
 
 
 def generate_ascii_bar(value: int, max_value: int, length: int = 50, char: str = '█') -> str:
@@ -167,6 +178,16 @@ def generate_language_bar(percentage: float, length: int = 40) -> str:
     return f"{bar} {percentage:.1f}%"
 
 
+@lru_cache(maxsize=256)
+def _display_key(key: str) -> str:
+    """
+    Convertit une clé snake_case en Title Case (ex: total_repos -> Total Repos)
+    
+    Mis en cache: les mêmes métriques reviennent à chaque rendu.
+    """
+    return key.replace('_', ' ').title()
+
+
 def create_stats_table(stats: Dict[str, Any], title: str = "Statistiques") -> str:
     """
     Crée un tableau markdown des statistiques
@@ -178,14 +199,9 @@ def create_stats_table(stats: Dict[str, Any], title: str = "Statistiques") -> st
     Returns:
         Tableau markdown formaté
     """
-    table = f"### {title}\n\n"
-    table += "| Métrique | Valeur |\n"
-    table += "|----------|--------|\n"
+    rows = [f"### {title}\n\n| Métrique | Valeur |\n|----------|--------|\n"]
     
     for key, value in stats.items():
-        # Formater la clé (convertir snake_case en Title Case)
-        display_key = key.replace('_', ' ').title()
-        
         # Formater la valeur
         if isinstance(value, int):
             display_value = format_number(value)
@@ -194,9 +210,45 @@ def create_stats_table(stats: Dict[str, Any], title: str = "Statistiques") -> st
         else:
             display_value = str(value)
         
-        table += f"| {display_key} | **{display_value}** |\n"
-    
-    return table
+        rows.append(f"| {_display_key(key)} | **{display_value}** |\n")
+    
+    return ''.join(rows)
+
+
+# Unités de format_relative_time, de la plus grande à la plus petite:
+# (0: jours / 1: secondes du jour, seuil strict, diviseur, unité, pluriel)
+_RELATIVE_UNITS = (
+    (0, 365, 365, 'an', 's'),
+    (0, 30, 30, 'mois', ''),
+    (0, 0, 1, 'jour', 's'),
+    (1, 3600, 3600, 'heure', 's'),
+    (1, 60, 60, 'minute', 's')
+)
+
+# Emojis par métrique (ordre significatif pour la recherche par sous-chaîne)
+_METRIC_EMOJIS = {
+    'stars': '⭐',
+    'commits': '📝',
+    'prs': '🔀',
+    'pull_requests': '🔀',
+    'issues': '❗',
+    'repos': '📦',
+    'repositories': '📦',
+    'forks': '🍴',
+    'followers': '👥',
+    'contributions': '🤝',
+    'languages': '💻',
+    'code': '💻',
+    'additions': '➕',
+    'deletions': '➖',
+    'changes': '🔄'
+}
+
+# Grille de la heatmap: jours, créneaux de 3h, cases par intensité
+_HEATMAP_DAYS = ('Lun', 'Mar', 'Mer', 'Jeu', 'Ven', 'Sam', 'Dim')
+_HEATMAP_HOURS = range(0, 24, 3)
+_HEATMAP_HEADER = "       " + "".join(f"{h:>3}" for h in _HEATMAP_HOURS) + "\n"
+_HEATMAP_CELLS = (" ⬜ ", " 🟩 ", " 🟨 ", " 🟧 ", " 🟥 ")
 
 
 def generate_heatmap_ascii(heatmap: Dict[int, Dict[int, int]]) -> str:
@@ -209,43 +261,25 @@ def generate_heatmap_ascii(heatmap: Dict[int, Dict[int, int]]) -> str:
     Returns:
         Heatmap en ASCII art
     """
-    days = ['Lun', 'Mar', 'Mer', 'Jeu', 'Ven', 'Sam', 'Dim']
+    # Valeur max pour la normalisation, seuils calculés une seule fois:
+    # l'emoji d'une case est celui du nombre de seuils atteints
+    max_value = max((max(day_data.values(), default=0) for day_data in heatmap.values()), default=0)
+    thresholds = (max_value * 0.25, max_value * 0.5, max_value * 0.75)
     
-    # Trouver la valeur max pour la normalisation
-    max_value = 0
-    for day_data in heatmap.values():
-        max_value = max(max_value, max(day_data.values(), default=0))
+    lines = ["```\n", _HEATMAP_HEADER]
     
-    # Générer la heatmap
-    result = "```\n"
-    result += "       " + "".join(f"{h:>3}" for h in range(0, 24, 3)) + "\n"
+    for day_num, day_name in enumerate(_HEATMAP_DAYS):
+        day_data = heatmap.get(day_num, {})
+        cells = ''.join(
+            _HEATMAP_CELLS[0 if not count else 1 + bisect_right(thresholds, count)]
+            for count in (day_data.get(hour, 0) for hour in _HEATMAP_HOURS)
+        )
+        lines.append(f"{day_name}   {cells}\n")
     
-    for day_num, day_name in enumerate(days):
-        result += f"{day_name}   "
-        
-        for hour in range(0, 24, 3):
-            count = heatmap.get(day_num, {}).get(hour, 0)
-            
-            # Choisir l'emoji selon l'intensité
-            if count == 0:
-                emoji = "⬜"
-            elif count < max_value * 0.25:
-                emoji = "🟩"
-            elif count < max_value * 0.5:
-                emoji = "🟨"
-            elif count < max_value * 0.75:
-                emoji = "🟧"
-            else:
-                emoji = "🟥"
-            
-            result += f" {emoji} "
-        
-        result += "\n"
+    lines.append("\n⬜ Aucune  🟩 Faible  🟨 Moyenne  🟧 Élevée  🟥 Très élevée\n")
+    lines.append("```\n")
     
-    result += "\n⬜ Aucune  🟩 Faible  🟨 Moyenne  🟧 Élevée  🟥 Très élevée\n"
-    result += "```\n"
-    
-    return result
+    return ''.join(lines)
 
 
 def create_badge_url(label: str, message: str, color: str, style: str = "for-the-badge") -> str:
@@ -283,19 +317,11 @@ def validate_github_token(token: str) -> bool:
     Returns:
         True si le format est valide
     """
-    if not token:
+    # Rejet rapide sur la longueur et le préfixe avant la regex
+    if not token or len(token) != 40 or not token.startswith(_TOKEN_PREFIXES):
         return False
     
-    # Les tokens GitHub commencent par ghp_, gho_, ghu_, ghs_, ou ghr_
-    patterns = [
-        r'^ghp_[a-zA-Z0-9]{36}$',  # Personal Access Token
-        r'^gho_[a-zA-Z0-9]{36}$',  # OAuth Token
-        r'^ghu_[a-zA-Z0-9]{36}$',  # User Token
-        r'^ghs_[a-zA-Z0-9]{36}$',  # Server Token
-        r'^ghr_[a-zA-Z0-9]{36}$',  # Refresh Token
-    ]
-    
-    return any(re.match(pattern, token) for pattern in patterns)
+    return _TOKEN_RE.fullmatch(token) is not None
 
 
 def validate_github_username(username: str) -> bool:
@@ -308,12 +334,15 @@ def validate_github_username(username: str) -> bool:
     Returns:
         True si le format est valide
     """
-    if not username:
+    # Username GitHub: alphanumerique + tirets, max 39 caractères
+    if not username or len(username) > 39:
         return False
     
-    # Username GitHub: alphanumerique + tirets, max 39 caractères
-    pattern = r'^[a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38}$'
-    return bool(re.match(pattern, username))
+    # Pas de tiret en début/fin ni de tirets consécutifs
+    if username[0] == '-' or username[-1] == '-' or '--' in username:
+        return False
+    
+    return all(c in _USERNAME_CHARS for c in username)
 
 
 def truncate_text(text: str, max_length: int = 50, suffix: str = "...") -> str:
@@ -355,37 +384,27 @@ def calculate_growth(current: int, previous: int) -> tuple[int, float]:
     return diff, percentage
 
 
+@lru_cache(maxsize=256)
 def get_emoji_for_metric(metric: str) -> str:
     """
     Retourne un emoji approprié pour une métrique
     
+    Correspondance exacte d'abord (accès direct au dictionnaire), puis
+    recherche d'une clé contenue dans le nom. Le résultat est mis en cache.
+    
     Args:
         metric: Nom de la métrique
     
     Returns:
         Emoji correspondant
     """
-    emoji_map = {
-        'stars': '⭐',
-        'commits': '📝',
-        'prs': '🔀',
-        'pull_requests': '🔀',
-        'issues': '❗',
-        'repos': '📦',
-        'repositories': '📦',
-        'forks': '🍴',
-        'followers': '👥',
-        'contributions': '🤝',
-        'languages': '💻',
-        'code': '💻',
-        'additions': '➕',
-        'deletions': '➖',
-        'changes': '🔄'
-    }
-    
     metric_lower = metric.lower()
     
-    for key, emoji in emoji_map.items():
+    emoji = _METRIC_EMOJIS.get(metric_lower)
+    if emoji is not None:
+        return emoji
+    
+    for key, emoji in _METRIC_EMOJIS.items():
         if key in metric_lower:
             return emoji
     
@@ -439,3 +458,95 @@ def chunk_list(lst: List, chunk_size: int) -> List[List]:
     """
     return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
 
+
+def iter_chunks(iterable: Iterable, chunk_size: int) -> Iterator[List]:
+    """
+    Divise un itérable en chunks, à la demande
+    
+    Contrairement à chunk_list, aucun chunk n'est construit avant d'être
+    demandé: adapté aux générateurs et aux grandes séquences traitées
+    par lots. Seul le chunk courant est en mémoire.
+    
+    Args:
+        iterable: Itérable à diviser (liste, générateur...)
+        chunk_size: Taille de chaque chunk
+    
+    Returns:
+        Itérateur de chunks (listes); le dernier peut être plus court
+    
+    Example:
+        >>> list(iter_chunks(range(5), 2))
+        [[0, 1], [2, 3], [4]]
+    """
+    iterator = iter(iterable)
+    return iter(lambda: list(islice(iterator, chunk_size)), [])
+
+
+def json_dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    Sérialise une donnée en JSON (UTF-8)
+    
+    Utilise orjson si disponible (sérialiseur C, un seul buffer),
+    sinon le module json standard. Les clés non-str (ex: heatmap
+    {jour: {heure: n}}) sont converties en chaînes dans les deux cas.
+    
+    Args:
+        data: Donnée à sérialiser
+        indent: Indenter avec 2 espaces
+    
+    Returns:
+        JSON encodé en UTF-8
+    
+    Example:
+        >>> json_dumps({'stars': 42})
+        b'{"stars":42}'
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def write_json(data: Any, filepath: Union[str, Path]) -> None:
+    """
+    Écrit une donnée dans un fichier JSON indenté (UTF-8)
+    
+    Avec orjson le document est produit en un seul buffer. Sans orjson,
+    json.dump écrit le document morceau par morceau (iterencode) au lieu
+    de construire la chaîne complète en mémoire.
+    
+    Args:
+        data: Donnée à sérialiser
+        filepath: Chemin du fichier de sortie
+    """
+    if orjson is not None:
+        Path(filepath).write_bytes(json_dumps(data, indent=True))
+        return
+    
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Désérialise un document JSON
+    
+    Args:
+        data: JSON en bytes ou str
+    
+    Returns:
+        Donnée désérialisée
+    
+    Raises:
+        json.JSONDecodeError: Si le document est invalide
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    
+    return json.loads(data)